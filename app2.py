@@ -1,68 +1,23 @@
 import streamlit as st
-from datetime import datetime, timedelta
-from PIL import Image
-import locale
+from datetime import datetime
 from math import ceil
 from io import BytesIO
-import subprocess
-import sys
 import re
 
-# --- Configuração de Locale ---
-def configure_locale():
-    """
-    Configura o locale para português do Brasil, tentando várias opções
-    para garantir compatibilidade em diferentes ambientes.
-    """
-    try:
-        locale.setlocale(locale.LC_ALL, 'pt_BR.UTF-8')
-    except locale.Error:
-        try:
-            locale.setlocale(locale.LC_ALL, 'pt_BR')
-        except locale.Error:
-            try:
-                locale.setlocale(locale.LC_ALL, 'Portuguese_Brazil.1252')
-            except locale.Error:
-                try:
-                    locale.setlocale(locale.LC_ALL, '')
-                except locale.Error:
-                    locale.setlocale(locale.LC_ALL, 'C.UTF-8')
-                    st.warning("Configuração de locale específica não disponível. Usando padrão internacional.")
-
-configure_locale()
-
-# --- Instalação e Importação de Dependências ---
-def install_and_import(package, import_name=None):
-    """
-    Tenta importar um pacote. Se não estiver disponível, instala-o.
-    """
-    import_name = import_name or package
-    try:
-        return __import__(import_name)
-    except ImportError:
-        st.info(f"Instalando {package}...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
-        st.success(f"{package} instalado com sucesso.")
-        return __import__(import_name)
-
-# Importa as bibliotecas necessárias
+from ativos import LOGO_PDF
+from inicializacao import LOCALE_RESERVA, aplicar_tema, configure_locale, install_and_import, logo_disponivel, mostrar_logo
+from motor_financeiro import (
+    calcular_taxas, calcular_valor_presente, fator_anuidade, fator_vp_meses,
+    formatar_moedas, meses_vencimento, montar_cronograma
+)
+
+# --- Configuração de Locale (uma vez por processo, em inicializacao.py) ---
+if configure_locale() == LOCALE_RESERVA:
+    st.warning("Configuração de locale específica não disponível. Usando padrão internacional.")
+
+# --- Dependências (fpdf e openpyxl só são importados quando há exportação) ---
 pd = install_and_import('pandas')
 np = install_and_import('numpy')
-FPDF = install_and_import('fpdf2', 'fpdf').FPDF
-
-# --- Carregamento da Logo (Cacheado) ---
-@st.cache_data(ttl=86400)
-def load_logo():
-    """
-    Carrega e redimensiona a imagem da logo.
-    """
-    try:
-        logo = Image.open("JMD HAMOA HORIZONTAL - BRANCO.png")
-        logo.thumbnail((300, 300))
-        return logo
-    except Exception as e:
-        st.warning(f"Não foi possível carregar a logo: {str(e)}.")
-        return None
 
 # --- Configuração da Página Streamlit e Tema ---
 st.set_page_config(layout="wide")
@@ -72,183 +27,7 @@ def set_theme():
     Aplica estilos CSS personalizados para um tema escuro
     e aprimora a aparência dos componentes do Streamlit.
     """
-    st.markdown("""
-    <style>
-        /* Fundo principal */
-        .stApp {
-            background-color: #1E1E1E;
-        }
-        
-        /* Sidebar */
-        [data-testid="stSidebar"] {
-            background-color: #252526;
-        }
-        
-        /* Títulos */
-        h1, h2, h3, h4, h5, h6, .stMarkdown h1, .stMarkdown h2, .stMarkdown h3 {
-            color: #FFFFFF;
-        }
-        
-        /* Texto geral */
-        .stMarkdown p, .stMarkdown li, .stText, .stNumberInput label, .stSelectbox label {
-            color: #E0E0E0;
-        }
-        
-        /* Inputs */
-        .stTextInput input, .stNumberInput input, .stSelectbox select {
-            background-color: #333333;
-            color: #FFFFFF;
-            border-color: #555555;
-        }
-        
-        /* Botões padrão (não os customizados abaixo) */
-        .stButton button {
-            background-color: #0056b3;
-            color: white;
-            border: none;
-            border-radius: 4px;
-        }
-        
-        .stButton button:hover {
-            background-color: #003d82;
-        }
-        
-        /* Cards/metricas */
-        .stMetric {
-            background-color: #252526;
-            border-radius: 8px;
-            padding: 15px;
-            border-left: 4px solid #4D6BFE; /* Cor da borda alterada para combinar com os botões */
-        }
-        
-        .stMetric label {
-            color: #A0A0A0 !important;
-        }
-        
-        .stMetric div {
-            color: #FFFFFF !important;
-            font-size: 24px !important;
-        }
-        
-        /* Dataframe */
-        .dataframe {
-            background-color: #252526 !important;
-            color: #E0E0E0 !important;
-        }
-        
-        .dataframe th {
-            background-color: #4D6BFE !important; /* Cor da borda alterada */
-            color: white !important;
-        }
-        
-        .dataframe tr:nth-child(even) {
-            background-color: #333333 !important;
-        }
-        
-        .dataframe tr:hover {
-            background-color: #444444 !important;
-        }
-
-        /* ===== LAYOUT ===== */
-        /* Container principal */
-        .main .block-container {
-            padding: 2rem 1rem !important;
-        }
-
-        /* Colunas e alinhamento */
-        [data-testid="column"] {
-            display: flex !important;
-            align-items: center !important;
-            justify-content: flex-start !important;
-            padding: 0 !important;
-        }
-
-        /* Espaçamento entre botões */
-        .stButton:first-of-type {
-            margin-right: 8px !important;
-        }
-
-        /* ===== FLICKERING FIX ===== */
-        [data-testid="stDataFrame-container"] {
-            will-change: transform !important;
-            contain: strict !important;
-            min-height: 400px !important;
-            transform: translate3d(0, 0, 0) !important;
-            backface-visibility: hidden !important;
-            perspective: 1000px !important;
-        }
-
-        .stDataFrame-fullscreen {
-            position: fixed !important;
-            top: 0 !important;
-            left: 0 !important;
-            right: 0 !important;
-            bottom: 0 !important;
-            z-index: 9999 !important;
-            background-color: #0E1117 !important;
-            padding: 2rem !important;
-            overflow: auto !important;
-        }
-
-        /* Títulos específicos para cor branca */
-        h1, h2, h3, h4, h5, h6, 
-        .stMarkdown h1, .stMarkdown h2, .stMarkdown h3,
-        /* Textos de input/labels */
-        .stTextInput label, .stNumberInput label, 
-        .stSelectbox label, .stDateInput label,
-        /* Subtítulos das seções */
-        .stSubheader,
-        /* Botões de exportação (labels) */
-        .stDownloadButton label {
-            color: #FFFFFF !important;
-        }
-        
-        /* Labels específicos que não são capturados pelas regras acima */
-        div[data-testid="stForm"] label,
-        div[data-testid="stVerticalBlock"] > div > div > div > div > label {
-            color: #FFFFFF !important;
-        }
-
-        /* BOTÕES PRINCIPAIS - ESTADO NORMAL (Calcular/Reiniciar/Exportar) */
-        div[data-testid="stForm"] button[kind="secondaryFormSubmit"],
-        div[data-testid="stForm"] button[kind="secondary"],
-        .stDownloadButton button {
-            background-color: #4D6BFE !important; /* Azul vibrante */
-            color: white !important;
-            border: none !important;
-            border-radius: 12px !important; /* Bordas super arredondadas */
-            padding: 10px 24px !important;
-            font-weight: 600 !important;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1) !important;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        }
-
-        /* EFEITO HOVER - VERMELHO INTENSO */
-        div[data-testid="stForm"] button[kind="secondaryFormSubmit"]:hover,
-        div[data-testid="stForm"] button[kind="secondary"]:hover,
-        .stDownloadButton button:hover {
-            background-color: #FF4D4D !important; /* Vermelho vibrante */
-            transform: translateY(-2px) !important;
-            box-shadow: 0 4px 8px rgba(255, 77, 77, 0.2) !important;
-        }
-
-        /* EFEITO CLIQUE */
-        div[data-testid="stForm"] button[kind="secondaryFormSubmit"]:active,
-        div[data-testid="stForm"] button[kind="secondary"]:active,
-        .stDownloadButton button:active {
-            transform: translateY(0) !important;
-            background-color: #E04444 !important; /* Vermelho mais escuro */
-        }
-
-        /* TEXTO DOS BOTÕES */
-        div[data-testid="stForm"] button > div > p,
-        .stDownloadButton button > div > p {
-            color: white !important;
-            font-size: 14px !important;
-            margin: 0 !important;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    aplicar_tema("simulador")  # temas/simulador.css
 
 # --- Funções de Cálculo Financeiro ---
 
@@ -283,86 +62,9 @@ def formatar_moeda(valor, simbolo=True):
         if isinstance(valor, str) and 'R$' in valor: valor = valor.replace('R$', '').strip()
         if valor is None or valor == '': return "R$ 0,00" if simbolo else "0,00"
         if isinstance(valor, str): valor = re.sub(r'\.', '', valor).replace(',', '.'); valor = float(valor)
-        valor_abs, parte_inteira = abs(valor), int(abs(valor))
-        parte_decimal = int(round((valor_abs - parte_inteira) * 100))
-        parte_inteira_str = f"{parte_inteira:,}".replace(",", ".")
-        valor_formatado = f"{parte_inteira_str},{parte_decimal:02d}"
-        if valor < 0: valor_formatado = f"-{valor_formatado}"
-        return f"R$ {valor_formatado}" if simbolo else valor_formatado
+        return formatar_moedas(valor, simbolo)[0]
     except Exception: return "R$ 0,00" if simbolo else "0,00"
 
-def calcular_taxas(taxa_mensal_percentual):
-    """
-    Calcula as taxas de juros equivalentes com base na taxa mensal.
-    """
-    try:
-        taxa_mensal_decimal = float(taxa_mensal_percentual) / 100
-        taxa_anual = ((1 + taxa_mensal_decimal) ** 12) - 1
-        taxa_semestral = ((1 + taxa_mensal_decimal) ** 6) - 1
-        taxa_diaria = ((1 + taxa_mensal_decimal) ** (1/30)) - 1
-        return {'anual': taxa_anual, 'semestral': taxa_semestral, 'mensal': taxa_mensal_decimal, 'diaria': taxa_diaria}
-    except Exception:
-        return {'anual': 0, 'semestral': 0, 'mensal': 0, 'diaria': 0}
-
-def calcular_valor_presente(valor_futuro, taxa_diaria, dias):
-    try:
-        if dias <= 0 or taxa_diaria <= 0: return float(valor_futuro)
-        return round(float(valor_futuro) / ((1 + taxa_diaria) ** dias), 2)
-    except Exception: return float(valor_futuro)
-
-def calcular_fator_vp(datas_vencimento, data_inicio, taxa_diaria):
-    """
-    Calcula o fator de valor presente somado para uma lista de datas, usando prazo comercial.
-    """
-    if taxa_diaria <= 0:
-        return float(len(datas_vencimento))
-    
-    fator_total = 0.0
-    for data_venc in datas_vencimento:
-        if not isinstance(data_venc, datetime):
-            data_venc = datetime.strptime(data_venc, '%d/%m/%Y')
-        
-        num_meses = (data_venc.year - data_inicio.year) * 12 + (data_venc.month - data_inicio.month)
-        dias_comerciais = num_meses * 30
-
-        if dias_comerciais > 0:
-            fator_total += 1 / ((1 + taxa_diaria) ** dias_comerciais)
-    return fator_total
-
-def ajustar_data_vencimento(data_base, periodo, num_periodo=1, dia_vencimento=None):
-    """
-    Calcula uma data futura com base em um período (mensal, semestral, anual).
-    """
-    try:
-        if not isinstance(data_base, datetime):
-            data_base = datetime.combine(data_base, datetime.min.time())
-
-        dia = dia_vencimento if dia_vencimento is not None else data_base.day
-
-        months_to_add = 0
-        if periodo == "mensal":
-            months_to_add = num_periodo
-        elif periodo == "semestral":
-            months_to_add = 6 * num_periodo
-        elif periodo == "anual":
-            months_to_add = 12 * num_periodo
-
-        if months_to_add == 0:
-            return data_base
-
-        total_meses = data_base.month + months_to_add
-        novo_ano = data_base.year + (total_meses - 1) // 12
-        novo_mes = (total_meses - 1) % 12 + 1
-
-        try:
-            return datetime(novo_ano, novo_mes, dia)
-        except ValueError:
-            # Se o dia não existe no mês (ex: 31 de Fev), usa o último dia do mês
-            ultimo_dia_do_mes = (datetime(novo_ano, novo_mes + 1, 1) - timedelta(days=1)).day if novo_mes < 12 else 31
-            return datetime(novo_ano, novo_mes, ultimo_dia_do_mes)
-    except Exception:
-        return data_base + timedelta(days=30 * (months_to_add or num_periodo))
-
 def determinar_modo_calculo(modalidade):
     return {"mensal": 1, "mensal + balão": 2, "só balão anual": 3, "só balão semestral": 4}.get(modalidade, 1)
 
@@ -375,6 +77,16 @@ def atualizar_baloes(modalidade, qtd_parcelas, tipo_balao=None):
         return 0
     except Exception: return 0
 
+def calcular_meses_baloes(agendamento_baloes, qtd_baloes, tipo_balao, meses_baloes=None, mes_primeiro_balao=None):
+    """
+    Prazos dos balões, em meses a partir da entrada, conforme o agendamento escolhido.
+    """
+    if agendamento_baloes == "Personalizado (Mês a Mês)":
+        return np.asarray(meses_baloes or [], dtype=np.int64)
+    if agendamento_baloes == "A partir do 1º Vencimento":
+        return meses_vencimento(tipo_balao, qtd_baloes, mes_primeiro_balao)
+    return meses_vencimento(tipo_balao, qtd_baloes) # Padrão
+
 @st.cache_data(ttl=3600)
 def gerar_cronograma(valor_financiado, valor_parcela_final, valor_balao_final,
                      qtd_parcelas, qtd_baloes, modalidade, tipo_balao,
@@ -382,112 +94,88 @@ def gerar_cronograma(valor_financiado, valor_parcela_final, valor_balao_final,
                      agendamento_baloes=None, meses_baloes=None, mes_primeiro_balao=None,
                      baloes_especiais=None):
     try:
-        dia_vencimento_real = data_entrada.day
-        parcelas, baloes = [], []
         baloes_especiais = baloes_especiais or {}
 
-        # Geração de Parcelas
-        if modalidade in ["mensal", "mensal + balão"]:
-            for i in range(1, qtd_parcelas + 1):
-                valor_corrente = valor_ultima_parcela if (i == qtd_parcelas and valor_ultima_parcela is not None) else valor_parcela_final
-                data_vencimento = ajustar_data_vencimento(data_entrada, "mensal", i, dia_vencimento_real)
-                dias_comerciais = i * 30
-                vp = calcular_valor_presente(valor_corrente, taxas['diaria'], dias_comerciais)
-                parcelas.append({"Item": f"Parcela {i}", "Tipo": "Parcela", "Data_Vencimento": data_vencimento.strftime('%d/%m/%Y'), "Dias": dias_comerciais, "Valor": round(valor_corrente, 2), "Valor_Presente": round(vp, 2), "Desconto_Aplicado": round(valor_corrente - vp, 2)})
+        # Parcelas: vencem mês a mês a partir da entrada
+        meses_p = np.arange(1, qtd_parcelas + 1) if modalidade in ["mensal", "mensal + balão"] else []
+        valores_p = np.full(len(meses_p), float(valor_parcela_final))
+        if valor_ultima_parcela is not None and len(valores_p):
+            valores_p[-1] = valor_ultima_parcela
 
         # Geração de Balões
-        datas_baloes_a_gerar = []
+        meses_b = np.zeros(0, dtype=np.int64)
         if "balão" in modalidade and qtd_baloes > 0:
-            if agendamento_baloes == "Personalizado (Mês a Mês)":
-                datas_baloes_a_gerar = [ajustar_data_vencimento(data_entrada, "mensal", mes, dia_vencimento_real) for mes in meses_baloes]
-            elif agendamento_baloes == "A partir do 1º Vencimento":
-                primeira_data_balao = ajustar_data_vencimento(data_entrada, "mensal", mes_primeiro_balao, dia_vencimento_real)
-                datas_baloes_a_gerar.append(primeira_data_balao)
-                data_anterior = primeira_data_balao
-                for _ in range(1, qtd_baloes):
-                    proxima_data_balao = ajustar_data_vencimento(data_anterior, tipo_balao, 1, dia_vencimento_real)
-                    datas_baloes_a_gerar.append(proxima_data_balao)
-                    data_anterior = proxima_data_balao
-            else: # Padrão
-                datas_baloes_a_gerar = [ajustar_data_vencimento(data_entrada, tipo_balao, i, dia_vencimento_real) for i in range(1, qtd_baloes + 1)]
-
-        for i, data_vencimento in enumerate(datas_baloes_a_gerar):
-            balao_count = i + 1
-            # Verifica se é um balão especial, senão usa o valor padrão
-            if balao_count in baloes_especiais:
-                valor_corrente = baloes_especiais[balao_count]
-            else:
-                valor_corrente = valor_ultimo_balao if (balao_count == qtd_baloes and valor_ultimo_balao is not None) else valor_balao_final
-
-            num_meses = (data_vencimento.year - data_entrada.year) * 12 + (data_vencimento.month - data_entrada.month)
-            dias_comerciais = num_meses * 30
-            vp = calcular_valor_presente(valor_corrente, taxas['diaria'], dias_comerciais)
-            baloes.append({"Item": f"Balão {balao_count}", "Tipo": "Balão", "Data_Vencimento": data_vencimento.strftime('%d/%m/%Y'), "Dias": dias_comerciais, "Valor": round(valor_corrente, 2), "Valor_Presente": round(vp, 2), "Desconto_Aplicado": round(valor_corrente - vp, 2)})
-
-        # Consolidação e Totalização
-        parcelas_sorted = sorted(parcelas, key=lambda x: datetime.strptime(x['Data_Vencimento'], '%d/%m/%Y'))
-        baloes_sorted = sorted(baloes, key=lambda x: datetime.strptime(x['Data_Vencimento'], '%d/%m/%Y'))
-        cronograma = parcelas_sorted + baloes_sorted
-
-        if cronograma:
-            total_valor = round(sum(p['Valor'] for p in cronograma), 2)
-            valor_presente_real = round(sum(p['Valor_Presente'] for p in cronograma), 2)
-            cronograma.append({"Item": "TOTAL", "Tipo": "", "Data_Vencimento": "", "Dias": "", "Valor": total_valor, "Valor_Presente": valor_presente_real, "Desconto_Aplicado": round(total_valor - valor_presente_real, 2)})
-        
-        return cronograma
+            meses_b = calcular_meses_baloes(agendamento_baloes, qtd_baloes, tipo_balao, meses_baloes, mes_primeiro_balao)
+        valores_b = np.full(meses_b.size, float(valor_balao_final))
+        if valor_ultimo_balao is not None and 0 < qtd_baloes <= meses_b.size:
+            valores_b[qtd_baloes - 1] = valor_ultimo_balao
+        # Balões especiais substituem o valor padrão
+        for balao_count, valor_especial in baloes_especiais.items():
+            if 1 <= balao_count <= meses_b.size:
+                valores_b[balao_count - 1] = valor_especial
+
+        return montar_cronograma(data_entrada, taxas['diaria'], meses_p, valores_p, meses_b, valores_b)
     except Exception as e:
         st.error(f"Erro inesperado ao gerar cronograma: {str(e)}.")
         return []
 
 
+@st.cache_resource(show_spinner=False)
+def modelo_pdf():
+    """
+    Modelo do PDF (layout, métricas das fontes e logo), montado uma vez por processo.
+    """
+    install_and_import('fpdf2', 'fpdf')
+    from relatorio_pdf import ModeloRelatorio
+    return ModeloRelatorio(colunas=["Item", "Tipo", "Data Venc.", "Valor", "Valor Presente", "Juros"], logo=LOGO_PDF if LOGO_PDF.exists() else None)
+
 def gerar_pdf(cronograma, dados):
-    try:
-        pdf = FPDF(); pdf.add_page(); pdf.set_font("Arial", 'B', 14)
-        pdf.cell(200, 10, txt="Informações do Imóvel", ln=1, align='L'); pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt=f"Quadra: {dados.get('quadra', 'N/I')}", ln=1); pdf.cell(200, 10, txt=f"Lote: {dados.get('lote', 'N/I')}", ln=1); pdf.cell(200, 10, txt=f"Metragem: {dados.get('metragem', 'N/I')} m²", ln=1)
-        pdf.ln(5); pdf.set_font("Arial", 'B', 14)
-        pdf.cell(200, 10, txt="Simulação de Financiamento", ln=1, align='L'); pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt=f"Valor Total do Imóvel: {formatar_moeda(dados['valor_total'])}", ln=1); pdf.cell(200, 10, txt=f"Entrada: {formatar_moeda(dados['entrada'])}", ln=1); pdf.cell(200, 10, txt=f"Valor Financiado: {formatar_moeda(dados['valor_financiado'])}", ln=1); pdf.cell(200, 10, txt=f"Taxa Mensal Utilizada: {dados['taxa_mensal']:.2f}%", ln=1)
-        pdf.ln(10); pdf.set_font("Arial", 'B', 12)
-        colunas = ["Item", "Tipo", "Data Venc.", "Valor", "Valor Presente", "Juros"]; larguras = [30, 25, 30, 35, 35, 35]
-        for col, larg in zip(colunas, larguras): pdf.cell(larg, 10, txt=col, border=1, align='C')
-        pdf.ln(); pdf.set_font("Arial", size=10)
-        cronograma_sem_total = [p for p in cronograma if p['Item'] != 'TOTAL']
-        for item in cronograma_sem_total:
-            pdf.cell(larguras[0], 8, txt=item['Item'], border=1); pdf.cell(larguras[1], 8, txt=item['Tipo'], border=1); pdf.cell(larguras[2], 8, txt=item['Data_Vencimento'], border=1)
-            pdf.cell(larguras[3], 8, txt=formatar_moeda(item['Valor'], simbolo=False), border=1, align='R'); pdf.cell(larguras[4], 8, txt=formatar_moeda(item['Valor_Presente'], simbolo=False), border=1, align='R'); pdf.cell(larguras[5], 8, txt=formatar_moeda(item['Desconto_Aplicado'], simbolo=False), border=1, align='R'); pdf.ln()
-        total = next((p for p in cronograma if p['Item'] == 'TOTAL'), None)
-        if total:
-            pdf.set_font("Arial", 'B', 10); pdf.cell(sum(larguras[:3]), 10, txt="TOTAL", border=1, align='R')
-            pdf.cell(larguras[3], 10, txt=formatar_moeda(total['Valor'], simbolo=False), border=1, align='R'); pdf.cell(larguras[4], 10, txt=formatar_moeda(total['Valor_Presente'], simbolo=False), border=1, align='R'); pdf.cell(larguras[5], 10, txt=formatar_moeda(total['Desconto_Aplicado'], simbolo=False), border=1, align='R')
-        return BytesIO(pdf.output())
-    except Exception as e: st.error(f"Erro ao gerar PDF: {str(e)}"); return BytesIO()
+    secoes = [
+        ("Informações do Imóvel", [f"Quadra: {dados.get('quadra', 'N/I')}", f"Lote: {dados.get('lote', 'N/I')}", f"Metragem: {dados.get('metragem', 'N/I')} m²"]),
+        ("Simulação de Financiamento", [f"Valor Total do Imóvel: {formatar_moeda(dados['valor_total'])}", f"Entrada: {formatar_moeda(dados['entrada'])}", f"Valor Financiado: {formatar_moeda(dados['valor_financiado'])}", f"Taxa Mensal Utilizada: {dados['taxa_mensal']:.2f}%"]),
+    ]
+    return BytesIO(modelo_pdf().gerar(cronograma, secoes))
 
 def gerar_excel(cronograma, dados):
-    try:
-        install_and_import('openpyxl'); output = BytesIO()
-        info_df = pd.DataFrame({'Campo': ['Quadra', 'Lote', 'Metragem', 'Valor Total do Imóvel', 'Entrada', 'Valor Financiado', 'Taxa Mensal Utilizada'], 'Valor': [dados.get('quadra', 'N/I'), dados.get('lote', 'N/I'), f"{dados.get('metragem', 'N/I')} m²", formatar_moeda(dados.get('valor_total', 0)), formatar_moeda(dados.get('entrada', 0)), formatar_moeda(dados.get('valor_financiado', 0)), f"{dados.get('taxa_mensal', 0):.2f}%"]})
-        df_cronograma_data = pd.DataFrame([p for p in cronograma if p['Item'] != 'TOTAL'])
-        df_cronograma_data.rename(columns={'Desconto_Aplicado': 'Juros'}, inplace=True)
-        total_row = next((p for p in cronograma if p['Item'] == 'TOTAL'), None)
-        if total_row:
-            total_row['Juros'] = total_row.get('Desconto_Aplicado')
-
-        df_final = pd.concat([df_cronograma_data, pd.DataFrame([total_row])], ignore_index=True) if total_row else df_cronograma_data
-        df_export = df_final[['Item', 'Tipo', 'Data_Vencimento', 'Valor', 'Valor_Presente', 'Juros']]
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            info_df.to_excel(writer, sheet_name='Informações da Simulação', index=False)
-            df_export.to_excel(writer, sheet_name='Cronograma de Pagamentos', index=False)
-        output.seek(0); return output
-    except Exception as e: st.error(f"Erro ao gerar Excel: {str(e)}"); return BytesIO()
+    install_and_import('openpyxl'); output = BytesIO()
+    info_df = pd.DataFrame({'Campo': ['Quadra', 'Lote', 'Metragem', 'Valor Total do Imóvel', 'Entrada', 'Valor Financiado', 'Taxa Mensal Utilizada'], 'Valor': [dados.get('quadra', 'N/I'), dados.get('lote', 'N/I'), f"{dados.get('metragem', 'N/I')} m²", formatar_moeda(dados.get('valor_total', 0)), formatar_moeda(dados.get('entrada', 0)), formatar_moeda(dados.get('valor_financiado', 0)), f"{dados.get('taxa_mensal', 0):.2f}%"]})
+    df_final = cronograma.para_dataframe(incluir_total=True).rename(columns={'Desconto_Aplicado': 'Juros'})
+    df_export = df_final[['Item', 'Tipo', 'Data_Vencimento', 'Valor', 'Valor_Presente', 'Juros']]
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        info_df.to_excel(writer, sheet_name='Informações da Simulação', index=False)
+        df_export.to_excel(writer, sheet_name='Cronograma de Pagamentos', index=False)
+    output.seek(0); return output
+
+# --- Exportação sob Demanda ---
+# Os arquivos só são gerados quando alguém clica para baixar e ficam em cache
+# pela assinatura do cronograma e pelos dados da simulação. Um erro na geração
+# sobe até o botão de download, que mostra a falha (e não entra no cache).
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def exportar_pdf(assinatura, dados, _cronograma):
+    return gerar_pdf(_cronograma, dados).getvalue()
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def exportar_excel(assinatura, dados, _cronograma):
+    return gerar_excel(_cronograma, dados).getvalue()
+
+# --- Exibição do Cronograma ---
+# Valores e datas vão para a tela como colunas numéricas; só o column_config
+# define como aparecem. "localized" segue o idioma do navegador (1.234,56 em
+# pt-BR) e o step fixa as casas decimais.
+COLUNAS_CRONOGRAMA = {
+    "Data_Vencimento": st.column_config.DateColumn("Data Venc.", format="DD/MM/YYYY"),
+    "Valor": st.column_config.NumberColumn("Valor (R$)", format="localized", step=0.01),
+    "Valor_Presente": st.column_config.NumberColumn("Valor Presente (R$)", format="localized", step=0.01),
+    "Desconto_Aplicado": st.column_config.NumberColumn("Juros (R$)", format="localized", step=0.01),
+}
 
 # --- Função Principal do Aplicativo Streamlit ---
 def main():
     set_theme()
     st.write("\n")
-    logo = load_logo()
-    if logo:
-        col1, col2 = st.columns([1, 4]); col1.image(logo, width=200, use_container_width=False)
+    if logo_disponivel():
+        col1, col2 = st.columns([1, 4])
+        with col1: mostrar_logo(200)
         col2.title("**Seja bem vindo ao Simulador da JMD HAMOA**")
     else: st.title("Simulador Imobiliária Celeste")
         
@@ -594,7 +282,7 @@ def main():
             valor_financiado = round(max(valor_total - entrada, 0), 2)
             taxas = calcular_taxas(taxa_mensal_para_calculo); modo = determinar_modo_calculo(modalidade)
             v_p_final, v_b_final = 0.0, 0.0; v_ultima_p, v_ultimo_b = None, None
-            data_entrada = datetime.combine(data_input, datetime.min.time()); dia_vencimento = data_entrada.day
+            data_entrada = datetime.combine(data_input, datetime.min.time())
             
             if taxa_mensal_para_calculo == 0.0:
                 # Lógica para planos sem juros (simplificada)
@@ -623,39 +311,29 @@ def main():
                         if num_baloes_regulares > 0: v_b_final = valor_uniforme
             
             else: # Lógica para planos com juros e balões especiais
-                # 1. Definir todas as datas de vencimento
-                datas_p = [ajustar_data_vencimento(data_entrada, "mensal", i, dia_vencimento) for i in range(1, (qtd_parcelas or 0) + 1)]
-                datas_b_todas = []
+                # 1. Definir os prazos (em meses) de todos os balões
+                meses_b_todos = []
                 if "balão" in modalidade and qtd_baloes > 0:
-                    if agendamento_baloes == "Personalizado (Mês a Mês)":
-                        datas_b_todas = [ajustar_data_vencimento(data_entrada, "mensal", mes, dia_vencimento) for mes in meses_baloes]
-                    elif agendamento_baloes == "A partir do 1º Vencimento":
-                        dt = ajustar_data_vencimento(data_entrada, "mensal", mes_primeiro_balao, dia_vencimento)
-                        datas_b_todas.append(dt)
-                        for _ in range(1, qtd_baloes):
-                            dt = ajustar_data_vencimento(dt, tipo_balao, 1, dia_vencimento)
-                            datas_b_todas.append(dt)
-                    else: # Padrão
-                        datas_b_todas = [ajustar_data_vencimento(data_entrada, tipo_balao, i, dia_vencimento) for i in range(1, qtd_baloes + 1)]
+                    meses_b_todos = calcular_meses_baloes(agendamento_baloes, qtd_baloes, tipo_balao, meses_baloes, mes_primeiro_balao).tolist()
 
                 # 2. Calcular VP dos balões com valor fixo (especiais)
                 vp_baloes_especiais = 0.0
-                datas_b_regulares = []
-                for i, data_b in enumerate(datas_b_todas):
+                meses_b_regulares = []
+                for i, num_meses in enumerate(meses_b_todos):
                     idx_balao = i + 1
                     if idx_balao in baloes_especiais_input:
-                        num_meses = (data_b.year - data_entrada.year) * 12 + (data_b.month - data_entrada.month)
                         dias_comerciais = num_meses * 30
                         vp_baloes_especiais += calcular_valor_presente(baloes_especiais_input[idx_balao], taxas['diaria'], dias_comerciais)
                     else:
-                        datas_b_regulares.append(data_b)
+                        meses_b_regulares.append(num_meses)
                 
                 vp_restante = valor_financiado - vp_baloes_especiais
                 if vp_restante < 0:
                     st.error("O valor presente dos balões especiais excede o valor financiado."); return
                 
-                fator_vp_p = calcular_fator_vp(datas_p, data_entrada, taxas['diaria'])
-                fator_vp_b_reg = calcular_fator_vp(datas_b_regulares, data_entrada, taxas['diaria'])
+                fator_vp_p = fator_anuidade(taxas['diaria'], qtd_parcelas or 0, "mensal")
+                # Balões podem ter agenda irregular (mês a mês, especiais): soma por prazo
+                fator_vp_b_reg = fator_vp_meses(meses_b_regulares, taxas['diaria'])
                 
                 # 3. Calcular valores restantes
                 if valor_parcela > 0 and valor_balao == 0: # Usuário informou parcela, calcular balão padrão
@@ -691,12 +369,8 @@ def main():
 
             st.subheader("Cronograma de Pagamentos")
             if cronograma:
-                df_cronograma = pd.DataFrame([p for p in cronograma if p['Item'] != 'TOTAL'])
-                df_display = df_cronograma.copy()
-                for col in ['Valor', 'Valor_Presente', 'Desconto_Aplicado']: df_display[col] = df_display[col].apply(lambda x: formatar_moeda(x, simbolo=True))
-                df_display.rename(columns={'Desconto_Aplicado': 'Juros'}, inplace=True)
-                st.dataframe(df_display, use_container_width=True, hide_index=True, column_config={"Data_Vencimento": "Data Venc."})
-                total = next((p for p in cronograma if p['Item'] == 'TOTAL'), None)
+                st.dataframe(cronograma.para_exibicao(), use_container_width=True, hide_index=True, column_config=COLUNAS_CRONOGRAMA)
+                total = cronograma.total
                 if total:
                     c1, c2, c3 = st.columns(3)
                     c1.metric("Valor Total a Pagar", formatar_moeda(total['Valor'])); c2.metric("Valor Presente Total", formatar_moeda(total['Valor_Presente'])); c3.metric("Total de Juros", formatar_moeda(total['Desconto_Aplicado']))
@@ -708,8 +382,8 @@ def main():
                     st.subheader("Exportar Resultados")
                     export_data = {'valor_total': valor_total, 'entrada': entrada, 'taxa_mensal': taxa_mensal_para_calculo, 'valor_financiado': valor_financiado, 'quadra': quadra, 'lote': lote, 'metragem': metragem}
                     c1_exp, c2_exp = st.columns(2)
-                    pdf_file = gerar_pdf(cronograma, export_data); c1_exp.download_button("Exportar para PDF", pdf_file, "simulacao.pdf", "application/pdf")
-                    excel_file = gerar_excel(cronograma, export_data); c2_exp.download_button("Exportar para Excel", excel_file, "simulacao.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+                    c1_exp.download_button("Exportar para PDF", lambda: exportar_pdf(cronograma.assinatura, export_data, cronograma), "simulacao.pdf", "application/pdf", on_click="ignore")
+                    c2_exp.download_button("Exportar para Excel", lambda: exportar_excel(cronograma.assinatura, export_data, cronograma), "simulacao.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", on_click="ignore")
         except Exception as e:
             st.error(f"Ocorreu um erro durante a simulação: {str(e)}. Por favor, verifique os valores inseridos e tente novamente.")
 
@@ -0,0 +1,107 @@
+# ativos.py
+"""
+Arquivos estáticos dos apps, gerados uma vez (na instalação ou no deploy) e
+não a cada processo: a logo já reduzida para a tela (PNG e WebP), a versão
+da logo para os PDFs e o CSS de cada tema de temas/, compactado.
+
+Tudo vai para static/, que o Streamlit serve direto com
+server.enableStaticServing (ver .streamlit/config.toml). Quando a fonte é
+mais nova que o arquivo gerado, ou ele não existe, gerar_ativos refaz só o
+que precisa; os apps chamam isso uma vez por processo.
+
+Não depende do Streamlit. Para gerar:
+
+    python ativos.py [--forcar]
+"""
+import re
+import sys
+from pathlib import Path
+
+PASTA_PROJETO = Path(__file__).resolve().parent
+PASTA_TEMAS = PASTA_PROJETO / "temas"
+PASTA_ESTATICA = PASTA_PROJETO / "static"
+URL_ESTATICA = "app/static"  # Caminho em que o Streamlit serve a pasta static/
+
+# --- Logo ---
+LOGO_ORIGINAL = PASTA_PROJETO / "JMD HAMOA HORIZONTAL - BRANCO.png"
+LOGO_PNG = PASTA_ESTATICA / "logo.png"
+LOGO_WEBP = PASTA_ESTATICA / "logo.webp"
+LOGO_PDF = PASTA_ESTATICA / "logo_pdf.png"
+TAMANHO_LOGO = (300, 300)    # Mesma redução que os apps faziam em cada processo
+LARGURA_LOGO_PDF_MM = 40     # Largura padrão da logo no ModeloRelatorio
+DPI_LOGO_PDF = 150
+COR_LOGO_PDF = (30, 30, 30)  # A logo é branca: no papel ela sai na cor do fundo do tema
+
+
+def _gerar_logos():
+    """Logo da tela (PNG e WebP) e logo do PDF: recortada nas bordas transparentes e escurecida."""
+    from PIL import Image
+
+    with Image.open(LOGO_ORIGINAL) as original:
+        logo = original.convert("RGBA")
+
+    tela = logo.copy()
+    tela.thumbnail(TAMANHO_LOGO)
+    tela.save(LOGO_PNG, optimize=True)
+    tela.save(LOGO_WEBP, lossless=True, method=6)
+
+    recorte = logo.crop(logo.getchannel("A").getbbox())
+    largura_px = round(LARGURA_LOGO_PDF_MM / 25.4 * DPI_LOGO_PDF)
+    recorte.thumbnail((largura_px, largura_px))
+    pdf = Image.new("RGBA", recorte.size, COR_LOGO_PDF + (0,))
+    pdf.putalpha(recorte.getchannel("A"))
+    pdf.save(LOGO_PDF, optimize=True)
+
+
+# --- Temas ---
+def compactar_css(css):
+    """Tira comentários e espaços do CSS."""
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return re.sub(r':\s+', ':', css).strip()
+
+
+def caminho_css(tema):
+    """Arquivo compactado do tema `tema` (nome de um .css de temas/)."""
+    return PASTA_ESTATICA / f"{tema}.min.css"
+
+
+def _gerar_css(fonte):
+    caminho_css(fonte.stem).write_text(compactar_css(fonte.read_text(encoding="utf-8")), encoding="utf-8")
+
+
+# --- Geração ---
+def _alvos():
+    """[(arquivos gerados, fonte, função que os gera)]."""
+    alvos = [((LOGO_PNG, LOGO_WEBP, LOGO_PDF), LOGO_ORIGINAL, _gerar_logos)]
+    for fonte in sorted(PASTA_TEMAS.glob("*.css")):
+        alvos.append(((caminho_css(fonte.stem),), fonte, lambda fonte=fonte: _gerar_css(fonte)))
+    return alvos
+
+
+def gerar_ativos(forcar=False):
+    """
+    Gera os arquivos de static/ que faltam ou estão mais velhos que a fonte
+    (todos, com `forcar`). Devolve a lista dos arquivos gerados.
+    """
+    PASTA_ESTATICA.mkdir(exist_ok=True)
+    gerados = []
+    for saidas, fonte, gerar in _alvos():
+        if not fonte.exists():
+            continue
+        modificado = fonte.stat().st_mtime
+        if forcar or any(not s.exists() or s.stat().st_mtime < modificado for s in saidas):
+            gerar()
+            gerados.extend(saidas)
+    return gerados
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    for caminho in gerar_ativos(forcar="--forcar" in argv):
+        print(f"{caminho.relative_to(PASTA_PROJETO)}: {caminho.stat().st_size:,} bytes")
+
+
+if __name__ == '__main__':
+    main()
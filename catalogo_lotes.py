@@ -0,0 +1,361 @@
+# catalogo_lotes.py
+"""
+Leitura das planilhas de lotes e o catálogo compacto com os lotes de todos
+os empreendimentos, com busca por (empreendimento, quadra, lote) e as listas
+de quadras e lotes para os filtros, compartilhado pelo processo.
+
+A planilha é convertida para um cache binário (Feather) em `.cache_lotes/`,
+ao lado dela. O nome do cache leva a data de modificação e o tamanho da
+planilha, então qualquer alteração no arquivo invalida o cache sozinha e as
+leituras seguintes não passam mais pelo openpyxl.
+
+Não depende do Streamlit.
+"""
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PASTA_CACHE = ".cache_lotes"
+VERSAO_CACHE = 4  # Mudar quando a leitura da planilha mudar, para refazer os caches
+
+# --- Leitura da Planilha de Lotes ---
+# Aceita "QD.01 LT.01" (Lotes.xlsx) e "QD.001 LT.001" (Simulador.xlsx), com ou
+# sem ponto/espaço, quadra com letras ("QD.A") e letra no fim do lote
+# ("LT.12A"). Códigos numéricos saem sem zeros extras, com dois dígitos no
+# mínimo: "001" e "1" viram "01"; quadras com letra só ficam em maiúsculas.
+PADRAO_IDENTIFICADOR = r'(?i)^\s*QD\.?\s*(?P<quadra>[0-9A-Z]+)\s*[-/]?\s*LT\.?\s*(?P<lote>\d+)(?P<sufixo>[A-Z]?)\s*$'
+# Nomes de coluna das outras planilhas -> nomes usados aqui
+COLUNAS_ALTERNATIVAS = {'identificador': 'IDENTIFICADOR', 'qtde': 'Área em Metro Quadrado'}
+
+
+def normalizar_codigo(codigo):
+    """Código de quadra no formato das chaves: "001", "1" e 1 viram "01"; "a" vira "A"."""
+    codigo = str(codigo).strip().upper()
+    return codigo.lstrip('0').zfill(2) if codigo.isdigit() else codigo
+
+def separar_identificador(identificadores):
+    """
+    Separa Quadra e Lote de uma coluna de IDENTIFICADOR de uma só vez, com
+    uma única extração por regex (no pyarrow, quando disponível). Linhas
+    vazias ou fora do padrão ficam com Quadra e Lote vazios ("").
+    """
+    texto = pd.Series(identificadores).astype('string')
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        partes = texto.str.extract(PADRAO_IDENTIFICADOR)
+        quadra = partes['quadra'].str.upper()
+        quadra = quadra.str.lstrip('0').str.zfill(2).where(quadra.str.isdigit().fillna(False), quadra)
+        lote = partes['lote'].str.lstrip('0').str.zfill(2) + partes['sufixo'].str.upper()
+        return pd.DataFrame({
+            'Quadra': quadra.fillna('').astype(object),
+            'Lote': lote.fillna('').astype(object),
+        }, index=texto.index)
+
+    partes = pc.extract_regex(pa.array(texto, type=pa.string()), PADRAO_IDENTIFICADOR)
+    codigo = lambda campo: pc.utf8_lpad(pc.utf8_ltrim(pc.struct_field(partes, campo), '0'), 2, '0')
+    quadra = pc.if_else(pc.utf8_is_digit(pc.struct_field(partes, 'quadra')), codigo('quadra'),
+                        pc.utf8_upper(pc.struct_field(partes, 'quadra')))
+    lote = pc.binary_join_element_wise(codigo('lote'), pc.utf8_upper(pc.struct_field(partes, 'sufixo')), '')
+    return pd.DataFrame({
+        'Quadra': quadra.fill_null('').to_numpy(zero_copy_only=False),
+        'Lote': lote.fill_null('').to_numpy(zero_copy_only=False),
+    }, index=texto.index)
+
+def identificadores_invalidos(df_lotes):
+    """
+    IDENTIFICADORes preenchidos que não puderam ser separados, indexados pelo
+    número da linha na planilha (o cabeçalho é a linha 1).
+    """
+    identificadores = df_lotes['IDENTIFICADOR']
+    falhas = (identificadores.notna() & (identificadores.astype(str).str.strip() != '') & (df_lotes['Quadra'] == '')).to_numpy()
+    return pd.Series(identificadores.to_numpy()[falhas], index=np.flatnonzero(falhas) + 2, dtype=object)
+
+def ler_planilha_lotes(arquivo, nome_arquivo=None):
+    """
+    Lê a planilha bruta de lotes (.xlsx ou .csv) e separa Quadra e Lote a
+    partir do IDENTIFICADOR. `arquivo` pode ser um caminho ou um arquivo
+    aberto; nesse caso, `nome_arquivo` indica a extensão.
+    """
+    nome_arquivo = str(nome_arquivo or arquivo)
+    if nome_arquivo.lower().endswith('.csv'): df_lotes = pd.read_csv(arquivo)
+    else: df_lotes = pd.read_excel(arquivo)
+
+    renomear = {}
+    for coluna in df_lotes.columns:
+        padrao = COLUNAS_ALTERNATIVAS.get(str(coluna).strip().lower())
+        if padrao and padrao not in df_lotes: renomear[coluna] = padrao
+    df_lotes = df_lotes.rename(columns=renomear)
+
+    df_lotes[['Quadra', 'Lote']] = separar_identificador(df_lotes['IDENTIFICADOR'])
+    return df_lotes
+
+
+# --- Cache em Disco ---
+def _temporario_ao_lado(destino):
+    """
+    Arquivo temporário exclusivo na pasta de `destino`, para gravar e depois
+    trocar com os.replace: processos que gravam o mesmo cache ao mesmo tempo
+    não escrevem um no arquivo do outro.
+    """
+    with tempfile.NamedTemporaryFile(dir=destino.parent, prefix=f"{destino.name}.", suffix='.tmp', delete=False) as arquivo:
+        return Path(arquivo.name)
+
+def _caminho_cache(caminho):
+    estado = os.stat(caminho)
+    pasta = Path(caminho).resolve().parent / PASTA_CACHE
+    return pasta / f"{Path(caminho).name}.{estado.st_mtime_ns}.{estado.st_size}.v{VERSAO_CACHE}.feather"
+
+def _ler_cache(arquivo):
+    try: return pd.read_feather(arquivo)
+    except ImportError:
+        with open(arquivo, 'rb') as entrada: return pickle.load(entrada)
+
+def _gravar_cache(df_lotes, arquivo, nome_planilha):
+    arquivo.parent.mkdir(exist_ok=True)
+    for antigo in arquivo.parent.glob(f"{nome_planilha}.*.feather"):
+        antigo.unlink(missing_ok=True)  # Caches de versões anteriores da planilha
+    temporario = _temporario_ao_lado(arquivo)
+    try:
+        try: df_lotes.reset_index(drop=True).to_feather(temporario)
+        except ImportError:
+            # Sem pyarrow: o mesmo cache, em pickle
+            with open(temporario, 'wb') as saida: pickle.dump(df_lotes, saida)
+        os.replace(temporario, arquivo)
+    finally:
+        temporario.unlink(missing_ok=True)
+
+def ler_lotes_com_cache(caminho):
+    """
+    DataFrame de lotes da planilha em `caminho`, lido do cache binário quando
+    a planilha não mudou desde a última leitura.
+    """
+    arquivo_cache = _caminho_cache(caminho)
+    if arquivo_cache.exists():
+        try: return _ler_cache(arquivo_cache)
+        except Exception: pass
+
+    df_lotes = ler_planilha_lotes(caminho)
+    try: _gravar_cache(df_lotes, arquivo_cache, Path(caminho).name)
+    except OSError: pass  # Sem permissão de escrita: segue sem cache
+    return df_lotes
+
+
+# --- Catálogo de Vários Empreendimentos ---
+# Planilhas de lotes de cada empreendimento (a primeira que puder ser lida),
+# relativas à pasta do projeto.
+FONTES_EMPREENDIMENTOS = {
+    "Celeste": ("Lotes.xlsx", "Lotes.xlsx - Planilha1.csv"),
+    "JMD Hamoa": ("Simulador.xlsx",),
+}
+PASTA_PROJETO = Path(__file__).resolve().parent
+
+
+class CatalogoCompacto:
+    """
+    Lotes de vários empreendimentos em colunas compactas: Empreendimento,
+    Quadra e Lote como categorias (códigos inteiros) e Área/Valor em float64.
+    As categorias seguem a ordem natural ("2" antes de "10", "12" antes de
+    "12A"), as linhas ficam ordenadas pela chave (empreendimento, quadra,
+    lote), e a busca é uma busca binária nessa chave, sem dicionário por lote.
+
+    Aberto de um arquivo Arrow mapeado em memória (abrir_catalogo_compacto),
+    as colunas são lidas direto do arquivo: processos diferentes que abrem o
+    mesmo catálogo compartilham as mesmas páginas do sistema operacional.
+
+        catalogo["Celeste", "01", "07"]   -> dados do lote (dict)
+        catalogo.quadras("Celeste")       -> quadras em ordem natural
+        catalogo.lotes("Celeste", "01")   -> lotes da quadra, em ordem natural
+    """
+
+    COLUNAS_CATEGORIAS = ("Empreendimento", "Quadra", "Lote")
+
+    def __init__(self, tabela):
+        self.tabela = tabela
+        self.categorias, self._codigos_categoria, codigos = {}, {}, {}
+        for coluna in self.COLUNAS_CATEGORIAS:
+            dados = tabela.column(coluna).combine_chunks()
+            self.categorias[coluna] = dados.dictionary.to_pylist()
+            self._codigos_categoria[coluna] = {valor: i for i, valor in enumerate(self.categorias[coluna])}
+            codigos[coluna] = dados.indices.to_numpy(zero_copy_only=False)
+        self._codigos = codigos
+        self.area = tabela.column("Área em Metro Quadrado").combine_chunks().to_numpy(zero_copy_only=False)
+        self.valor = tabela.column("Valor a Vista").combine_chunks().to_numpy(zero_copy_only=False)
+
+        self._qtd_quadras = max(len(self.categorias["Quadra"]), 1)
+        self._qtd_lotes = max(len(self.categorias["Lote"]), 1)
+        self.chaves = tabela.column("Chave").combine_chunks().to_numpy(zero_copy_only=False)  # Ordenadas
+
+    def _chave(self, empreendimento, quadra=0, lote=0):
+        return (empreendimento * self._qtd_quadras + quadra) * self._qtd_lotes + lote
+
+    def _faixa(self, inicio, fim):
+        return np.searchsorted(self.chaves, inicio), np.searchsorted(self.chaves, fim)
+
+    def _codigo(self, coluna, valor):
+        return self._codigos_categoria[coluna].get(valor)
+
+    def __len__(self):
+        return len(self.chaves)
+
+    def _posicao(self, chave):
+        empreendimento, quadra, lote = chave
+        codigos = (self._codigo("Empreendimento", empreendimento), self._codigo("Quadra", quadra), self._codigo("Lote", lote))
+        if None in codigos: return None
+        alvo = self._chave(*codigos)
+        posicao = np.searchsorted(self.chaves, alvo)
+        return posicao if posicao < len(self.chaves) and self.chaves[posicao] == alvo else None
+
+    def __contains__(self, chave):
+        return self._posicao(chave) is not None
+
+    def __getitem__(self, chave):
+        posicao = self._posicao(chave)
+        if posicao is None: raise KeyError(chave)
+        empreendimento, quadra, lote = chave
+        return {
+            "Empreendimento": empreendimento, "Quadra": quadra, "Lote": lote,
+            "Área em Metro Quadrado": float(self.area[posicao]), "Valor a Vista": float(self.valor[posicao]),
+        }
+
+    def get(self, chave, padrao=None):
+        try: return self[chave]
+        except KeyError: return padrao
+
+    @property
+    def empreendimentos(self):
+        return [self.categorias["Empreendimento"][c] for c in np.unique(self._codigos["Empreendimento"])]
+
+    def quadras(self, empreendimento):
+        codigo = self._codigo("Empreendimento", empreendimento)
+        if codigo is None: return []
+        inicio, fim = self._faixa(self._chave(codigo), self._chave(codigo + 1))
+        return [self.categorias["Quadra"][c] for c in np.unique(self._codigos["Quadra"][inicio:fim])]
+
+    def lotes(self, empreendimento, quadra):
+        codigo_e, codigo_q = self._codigo("Empreendimento", empreendimento), self._codigo("Quadra", quadra)
+        if codigo_e is None or codigo_q is None: return []
+        inicio, fim = self._faixa(self._chave(codigo_e, codigo_q), self._chave(codigo_e, codigo_q + 1))
+        return [self.categorias["Lote"][c] for c in self._codigos["Lote"][inicio:fim]]
+
+    @property
+    def nbytes(self):
+        return self.tabela.nbytes
+
+
+def _ordem_natural(codigo):
+    """Chave de ordenação de quadras e lotes pelo número: "2" < "10" < "10A"."""
+    numero = re.match(r'\d+', codigo)
+    return (0, int(numero.group()), codigo[numero.end():]) if numero else (1, 0, codigo)
+
+def _ler_primeira_fonte(caminhos, pasta):
+    for caminho in caminhos:
+        try: return ler_lotes_com_cache(Path(pasta) / caminho)
+        except Exception: continue
+    return None
+
+def _assinatura_fontes(fontes, pasta):
+    """Nome, data de modificação e tamanho das planilhas que existem."""
+    partes = []
+    for empreendimento, caminhos in sorted(fontes.items()):
+        for caminho in caminhos:
+            arquivo = Path(pasta) / caminho
+            if arquivo.exists():
+                estado = arquivo.stat()
+                partes.append(f"{empreendimento}|{caminho}|{estado.st_mtime_ns}|{estado.st_size}")
+    return hashlib.sha1("\n".join(partes).encode()).hexdigest()[:16]
+
+def montar_catalogo_compacto(fontes=None, pasta=PASTA_PROJETO, destino=None):
+    """
+    Lê as planilhas de cada empreendimento e grava o catálogo compacto num
+    arquivo Arrow (sem compressão, para poder ser mapeado em memória).
+    Devolve o caminho do arquivo.
+    """
+    import pyarrow as pa
+
+    fontes = fontes or FONTES_EMPREENDIMENTOS
+    partes = []
+    for empreendimento, caminhos in fontes.items():
+        df_lotes = _ler_primeira_fonte(caminhos, pasta)
+        if df_lotes is None or df_lotes.empty: continue
+        validos = (df_lotes['Quadra'] != '') & (df_lotes['Lote'] != '')
+        df_lotes = df_lotes.loc[validos]
+        partes.append(pd.DataFrame({
+            "Empreendimento": empreendimento,
+            "Quadra": df_lotes['Quadra'].to_numpy(dtype=object),
+            "Lote": df_lotes['Lote'].to_numpy(dtype=object),
+            "Área em Metro Quadrado": pd.to_numeric(df_lotes.get('Área em Metro Quadrado'), errors='coerce'),
+            "Valor a Vista": pd.to_numeric(df_lotes.get('Valor a Vista'), errors='coerce'),
+        }))
+    lotes = pd.concat(partes, ignore_index=True) if partes else pd.DataFrame(
+        columns=["Empreendimento", "Quadra", "Lote", "Área em Metro Quadrado", "Valor a Vista"])
+
+    colunas = {}
+    codigos = {}
+    for coluna in CatalogoCompacto.COLUNAS_CATEGORIAS:
+        categorias = pd.Categorical(lotes[coluna].astype(str), categories=sorted(set(lotes[coluna].astype(str)), key=_ordem_natural))
+        colunas[coluna], codigos[coluna] = categorias, categorias.codes.astype(np.int64)
+    qtd_q, qtd_l = max(len(colunas["Quadra"].categories), 1), max(len(colunas["Lote"].categories), 1)
+    chave = (codigos["Empreendimento"] * qtd_q + codigos["Quadra"]) * qtd_l + codigos["Lote"]
+
+    # Ordena pela chave; chaves repetidas ficam com a primeira linha da planilha
+    ordem = np.argsort(chave, kind='stable')
+    ordem = ordem[np.r_[True, np.diff(chave[ordem]) != 0]] if len(ordem) else ordem
+    # Códigos e chave no menor tipo inteiro que comporta os valores
+    menor_inteiro = lambda maximo: np.int8 if maximo < 2**7 else np.int16 if maximo < 2**15 else np.int32 if maximo < 2**31 else np.int64
+    tabela = pa.table({
+        **{coluna: pa.DictionaryArray.from_arrays(
+            pa.array(codigos[coluna][ordem].astype(menor_inteiro(len(colunas[coluna].categories)))),
+            pa.array(list(colunas[coluna].categories), type=pa.string()))
+           for coluna in CatalogoCompacto.COLUNAS_CATEGORIAS},
+        "Área em Metro Quadrado": pa.array(lotes["Área em Metro Quadrado"].to_numpy(dtype=np.float64)[ordem]),
+        "Valor a Vista": pa.array(lotes["Valor a Vista"].to_numpy(dtype=np.float64)[ordem]),
+        "Chave": pa.array(chave[ordem].astype(menor_inteiro(len(colunas["Empreendimento"].categories) * qtd_q * qtd_l))),
+    })
+
+    destino = Path(destino or Path(pasta) / PASTA_CACHE / f"catalogo.{_assinatura_fontes(fontes, pasta)}.v{VERSAO_CACHE}.arrow")
+    destino.parent.mkdir(exist_ok=True)
+    temporario = _temporario_ao_lado(destino)
+    try:
+        with pa.OSFile(str(temporario), 'wb') as saida, pa.ipc.new_file(saida, tabela.schema) as escritor:
+            escritor.write_table(tabela)
+        os.replace(temporario, destino)
+    finally:
+        temporario.unlink(missing_ok=True)
+    return destino
+
+def abrir_catalogo_compacto(caminho):
+    """Abre o catálogo gravado por montar_catalogo_compacto, mapeado em memória."""
+    import pyarrow as pa
+
+    return CatalogoCompacto(pa.ipc.open_file(pa.memory_map(str(caminho), 'r')).read_all())
+
+_catalogos_abertos = {}
+_trava_catalogos = threading.Lock()
+
+def catalogo_compartilhado(fontes=None, pasta=PASTA_PROJETO):
+    """
+    Catálogo compacto único por processo: todas as sessões (e todos os apps
+    que rodam no mesmo processo) recebem a mesma instância. Quando alguma
+    planilha muda, o catálogo é remontado na próxima chamada.
+    """
+    fontes = fontes or FONTES_EMPREENDIMENTOS
+    arquivo = Path(pasta) / PASTA_CACHE / f"catalogo.{_assinatura_fontes(fontes, pasta)}.v{VERSAO_CACHE}.arrow"
+    chave = (repr(sorted(fontes.items())), str(pasta))
+    with _trava_catalogos:
+        aberto = _catalogos_abertos.get(chave)
+        if aberto is None or aberto[0] != arquivo:
+            if not arquivo.exists(): montar_catalogo_compacto(fontes, pasta, arquivo)
+            if aberto is not None:
+                try: aberto[0].unlink(missing_ok=True)  # Versão anterior das planilhas
+                except OSError: pass  # No Windows, o arquivo ainda mapeado não pode ser apagado
+            aberto = _catalogos_abertos[chave] = (arquivo, abrir_catalogo_compacto(arquivo))
+        return aberto[1]
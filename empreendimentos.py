@@ -0,0 +1,171 @@
+# empreendimentos.py
+"""
+Cadastro dos empreendimentos atendidos pelo simulador.py: título, faixas de
+taxa por prazo, limites de prazo e rótulos de cada um. O que antes era um
+script por empreendimento (hamoaf.py, jatai.py, Rioverde.py...) passa a ser
+uma entrada deste dicionário, e um único servidor atende todos eles.
+
+Não depende do Streamlit.
+"""
+from regras_comerciais import TabelaFaixas
+
+# --- Rótulos Comuns ---
+TITULO_HAMOA = "Seja bem vindo ao Simulador da JMD HAMOA"
+ROTULO_PRAZO_BALOES_ANUAIS = "Qtd. de Parcelas/Meses (Balões anuais 48m = 4 balões)"
+ROTULO_PRAZO_SO_BALOES = "Qtd. de Parcelas/Meses:Plano só balões 48 meses = 4 balões anual; 8 balões semestrais"
+
+# --- Cadastro ---
+# faixas: [(prazo final da faixa, taxa mensal %)], em ordem crescente de prazo.
+# taxa_exibida: taxa do campo "Taxa de Juros Mensal Máxima"; None mostra a
+# tabela de faixas no lugar do campo.
+# valores_em_texto: valores em campos de texto ("250.000,00") ou numéricos.
+EMPREENDIMENTOS = {
+    "hamoa": {
+        "nome": "JMD Hamoa (até 176 meses)",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (60, 0.50), (176, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 176, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_BALOES_ANUAIS,
+        "taxa_exibida": None,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Aplicada", "formato_taxa": "{:.3f}% a.m.",
+    },
+    "hamoaf": {
+        "nome": "JMD Hamoa - 144 meses a 0,75%",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (144, 0.75)],
+        "prazo_minimo": 0, "prazo_maximo": 144, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_SO_BALOES,
+        "taxa_exibida": 0.75,
+        "valores_em_texto": False,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "aqhamoaf": {
+        "nome": "JMD Hamoa - 156 meses a 0,75%",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (156, 0.75)],
+        "prazo_minimo": 0, "prazo_maximo": 156, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_SO_BALOES,
+        "taxa_exibida": 0.75,
+        "valores_em_texto": False,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "jatai": {
+        "nome": "JMD Hamoa Jataí",
+        "titulo": f"{TITULO_HAMOA} (Jataí)",
+        "faixas": [(36, 0.0), (180, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 180, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_SO_BALOES,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": False,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "jatatijuros60meses": {
+        "nome": "JMD Hamoa Jataí - sem juros até 60 meses",
+        "titulo": f"{TITULO_HAMOA} (Jataí)",
+        "faixas": [(60, 0.0), (180, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 180, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_SO_BALOES,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": False,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "rioverde": {
+        "nome": "JMD Hamoa Rio Verde",
+        "titulo": f"{TITULO_HAMOA} (Rio Verde)",
+        "faixas": [(36, 0.0), (144, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 144, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_SO_BALOES,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": False,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "sinop2": {
+        "nome": "JMD Hamoa Sinop - 120 a 156 meses",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(156, 0.79)],
+        "prazo_minimo": 120, "prazo_maximo": 156, "prazo_padrao": 120,
+        "rotulo_prazo": "Qtd. de Parcelas/Meses",
+        "taxa_exibida": 0.79,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "hamoasinop": {
+        "nome": "JMD Hamoa Sinop",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (60, 0.50), (156, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 156, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_BALOES_ANUAIS,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "hamoaprimavera": {
+        "nome": "JMD Hamoa Primavera",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (48, 0.395), (60, 0.59), (156, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 156, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_BALOES_ANUAIS,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "altafloresta050": {
+        "nome": "JMD Hamoa Alta Floresta - 120 meses a 0,50%",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(120, 0.50)],
+        "prazo_minimo": 120, "prazo_maximo": 120, "prazo_padrao": 120,
+        "rotulo_prazo": "Qtd. de Parcelas/Meses",
+        "taxa_exibida": 0.50,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+    "simuhs": {
+        "nome": "JMD Hamoa (até 156 meses)",
+        "titulo": TITULO_HAMOA,
+        "faixas": [(36, 0.0), (48, 0.395), (60, 0.59), (156, 0.79)],
+        "prazo_minimo": 0, "prazo_maximo": 156, "prazo_padrao": 0,
+        "rotulo_prazo": ROTULO_PRAZO_BALOES_ANUAIS,
+        "taxa_exibida": 0.79,
+        "valores_em_texto": True,
+        "rotulo_taxa": "Taxa Mensal Utilizada", "formato_taxa": "{:.3f}%",
+    },
+}
+
+EMPREENDIMENTO_PADRAO = "hamoa"
+
+
+def obter_empreendimento(chave):
+    """Configuração do empreendimento; chaves desconhecidas caem no padrão."""
+    return EMPREENDIMENTOS.get(chave, EMPREENDIMENTOS[EMPREENDIMENTO_PADRAO])
+
+
+# Faixas de todos os empreendimentos compiladas numa só tabela
+TAXAS_POR_EMPREENDIMENTO = TabelaFaixas({chave: config["faixas"] for chave, config in EMPREENDIMENTOS.items()})
+
+
+def taxa_por_prazo(chave, qtd_parcelas):
+    """
+    Taxa mensal (%) da faixa em que o prazo cai, no empreendimento `chave`.
+    Abaixo de 1 mês ou acima da última faixa, 0% (o campo de prazo já limita a
+    quantidade ao prazo máximo). Aceita arrays de chaves e prazos.
+    """
+    return TAXAS_POR_EMPREENDIMENTO(qtd_parcelas, chave)
+
+
+def _formatar_taxa(taxa):
+    if taxa == 0:
+        return "0%"
+    casas = 2 if round(taxa, 2) == taxa else 3
+    return f"{taxa:.{casas}f}%".replace(".", ",")
+
+
+def descrever_faixas(config):
+    """Texto do quadro de faixas de juros (markdown), como "Até 36 meses: 0% a.m."."""
+    linhas = []
+    inicio = None
+    for prazo_final, taxa in config["faixas"]:
+        prazo = f"Até {prazo_final} meses" if inicio is None else f"{inicio} a {prazo_final} meses"
+        linhas.append(f"- {prazo}: **{_formatar_taxa(taxa)} a.m.**")
+        inicio = prazo_final + 1
+    return "📈 **Juros baseados no prazo do plano:**\n" + "\n".join(linhas)
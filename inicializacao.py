@@ -0,0 +1,158 @@
+# inicializacao.py
+"""
+Inicialização compartilhada pelos apps Streamlit, feita uma vez por processo.
+
+O Streamlit reexecuta o script do app a cada interação, mas os módulos
+importados por ele ficam carregados: o que está aqui (locale, verificação e
+instalação de dependências, leitura do tema e da logo gerados por ativos.py)
+roda na primeira execução e é reaproveitado nas seguintes.
+
+Para acompanhar o tempo de partida a frio de cada app:
+
+    python inicializacao.py [app.py simulador.py ...]
+"""
+import importlib
+import locale
+import re
+import subprocess
+import sys
+from functools import lru_cache
+
+import streamlit as st
+
+import ativos
+
+# --- Locale ---
+LOCALES_PT_BR = ('pt_BR.UTF-8', 'pt_BR', 'Portuguese_Brazil.1252', '')
+LOCALE_RESERVA = 'C.UTF-8'
+
+
+@lru_cache(maxsize=None)
+def configure_locale():
+    """
+    Configura o locale para português do Brasil, tentando várias opções
+    para garantir compatibilidade em diferentes ambientes. Devolve o locale
+    escolhido (LOCALE_RESERVA quando nenhum dos pt_BR existe).
+    """
+    for nome in LOCALES_PT_BR:
+        try:
+            locale.setlocale(locale.LC_ALL, nome)
+            return nome
+        except locale.Error:
+            continue
+    locale.setlocale(locale.LC_ALL, LOCALE_RESERVA)
+    return LOCALE_RESERVA
+
+
+# --- Instalação e Importação de Dependências ---
+@lru_cache(maxsize=None)
+def install_and_import(package, import_name=None):
+    """
+    Tenta importar um pacote. Se não estiver disponível, instala-o
+    usando pip e tenta importar novamente. O resultado fica guardado: o pip
+    roda no máximo uma vez por pacote e processo.
+    """
+    import_name = import_name or package
+    try:
+        return importlib.import_module(import_name)
+    except ImportError:
+        st.info(f"Instalando {package}...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+        st.success(f"{package} instalado com sucesso.")
+        return importlib.import_module(import_name)
+
+
+# --- Tema e Logo (arquivos de static/, gerados por ativos.py) ---
+@lru_cache(maxsize=None)
+def preparar_ativos():
+    """
+    Confere os arquivos de static/ (gerando o que faltar, quando o deploy não
+    rodou `python ativos.py`) e diz se o Streamlit está servindo a pasta.
+    """
+    try:
+        ativos.gerar_ativos()
+    except Exception as e:
+        st.warning(f"Não foi possível gerar os arquivos de static/: {str(e)}.")
+    return bool(st.get_option("server.enableStaticServing"))
+
+
+def logo_disponivel():
+    preparar_ativos()
+    return ativos.LOGO_PNG.exists()
+
+
+@lru_cache(maxsize=None)
+def _html_tema(tema):
+    return f"<style>{ativos.caminho_css(tema).read_text(encoding='utf-8')}</style>"
+
+
+def aplicar_tema(tema):
+    """
+    Envia o CSS já compactado do tema (temas/<tema>.css). O Streamlit só
+    mantém na página o que o script desenha a cada execução, então o envio se
+    repete; a leitura do arquivo, não. O CSS vai embutido porque versões do
+    Streamlit anteriores ao servidor Starlette servem .css como text/plain.
+    """
+    preparar_ativos()
+    st.markdown(_html_tema(tema), unsafe_allow_html=True)
+
+
+def mostrar_logo(largura=200):
+    """
+    Logo já reduzida: pelo static/ (WebP, com PNG de reserva), que o navegador
+    guarda em cache, ou como imagem do Streamlit quando a pasta não é servida.
+    """
+    if preparar_ativos():
+        st.markdown(
+            f'<picture><source srcset="{ativos.URL_ESTATICA}/{ativos.LOGO_WEBP.name}" type="image/webp">'
+            f'<img src="{ativos.URL_ESTATICA}/{ativos.LOGO_PNG.name}" width="{largura}" alt="Logo"></picture>',
+            unsafe_allow_html=True,
+        )
+    else:
+        st.image(str(ativos.LOGO_PNG), width=largura)
+
+
+# --- Relatório de Importação ---
+ENTRADAS = ["app.py", "app2.py", "app3.py", "appcorretores.py", "simulador.py", "tabelapreco.py"]
+
+_MEDIR_ENTRADA = (
+    "import runpy, sys, time\n"
+    "print('INICIO', file=sys.stderr, flush=True)\n"
+    "inicio = time.perf_counter()\n"
+    "runpy.run_path(sys.argv[1], run_name='__relatorio__')\n"
+    "print(f'TOTAL {(time.perf_counter() - inicio) * 1000:.1f}')\n"
+)
+
+
+def medir_importacao(script, qtd_modulos=8):
+    """
+    Executa a parte de módulo de `script` (sem chamar main) num processo novo,
+    com `python -X importtime`. Devolve o tempo total (ms) e os `qtd_modulos`
+    pacotes de primeiro nível que mais pesaram, como [(ms, nome), ...].
+    """
+    resultado = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _MEDIR_ENTRADA, script],
+        capture_output=True, text=True,
+    )
+    total = re.search(r'^TOTAL ([\d.]+)$', resultado.stdout, re.MULTILINE)
+    modulos = []
+    # Só o que o script importou, não a partida do interpretador
+    _, _, saida_importacao = resultado.stderr.partition('INICIO\n')
+    for linha in saida_importacao.splitlines():
+        partes = re.match(r'import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)', linha)
+        if partes and partes.group(2) == '':
+            modulos.append((int(partes.group(1)) / 1000, partes.group(3)))
+    modulos.sort(reverse=True)
+    return (float(total.group(1)) if total else float('nan')), modulos[:qtd_modulos]
+
+
+def main(scripts=None):
+    for script in scripts or ENTRADAS:
+        total, modulos = medir_importacao(script)
+        print(f"{script}: {total:,.0f} ms")
+        for ms, nome in modulos:
+            print(f"    {ms:8,.1f} ms  {nome}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
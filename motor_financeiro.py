@@ -0,0 +1,520 @@
+# motor_financeiro.py
+"""
+Motor financeiro compartilhado pelos simuladores.
+
+As funções aceitam escalares ou arrays NumPy (prazos, taxas e valores) e
+devolvem arrays no mesmo formato, de modo que todos os apps usem o mesmo
+caminho de cálculo vetorizado. O módulo não depende do Streamlit: os apps
+cuidam do cache e das mensagens de erro.
+"""
+import hashlib
+from datetime import datetime, timedelta
+from functools import cached_property, lru_cache
+
+import numpy as np
+import pandas as pd
+
+# --- Convenções Comerciais ---
+DIAS_POR_MES = 30  # Prazo comercial: todo mês conta como 30 dias
+MESES_POR_PERIODO = {"mensal": 1, "semestral": 6, "anual": 12}
+
+
+def _escalar_ou_array(resultado):
+    """
+    Devolve um float quando o cálculo foi feito sobre escalares e o próprio
+    array nos demais casos.
+    """
+    return float(resultado) if np.ndim(resultado) == 0 else resultado
+
+
+# --- Taxas e Valor Presente ---
+
+def calcular_taxas(taxa_mensal_percentual):
+    """
+    Calcula as taxas equivalentes (anual, semestral, mensal e diária) a partir
+    da taxa mensal em percentual. Aceita um escalar ou um array de taxas.
+    """
+    try:
+        taxa_mensal_decimal = np.asarray(taxa_mensal_percentual, dtype=np.float64) / 100
+    except (ValueError, TypeError):
+        return {'anual': 0, 'semestral': 0, 'mensal': 0, 'diaria': 0}
+
+    base = 1 + taxa_mensal_decimal
+    return {
+        'anual': _escalar_ou_array(base ** 12 - 1),
+        'semestral': _escalar_ou_array(base ** 6 - 1),
+        'mensal': _escalar_ou_array(taxa_mensal_decimal),
+        'diaria': _escalar_ou_array(base ** (1 / DIAS_POR_MES) - 1),
+    }
+
+
+def calcular_valor_presente(valor_futuro, taxa_diaria, dias):
+    """
+    Traz valores futuros a valor presente (arredondado em centavos).
+    Vencimentos sem prazo ou com taxa nula mantêm o valor original.
+    """
+    valor_futuro = np.asarray(valor_futuro, dtype=np.float64)
+    taxa_diaria = np.asarray(taxa_diaria, dtype=np.float64)
+    dias = np.asarray(dias, dtype=np.float64)
+
+    descontado = np.round(valor_futuro / (1 + taxa_diaria) ** dias, 2)
+    sem_desconto = (dias <= 0) | (taxa_diaria <= 0)
+    return _escalar_ou_array(np.where(sem_desconto, valor_futuro, descontado))
+
+
+def fator_vp_meses(meses, taxa_diaria):
+    """
+    Soma dos fatores de desconto para vencimentos a `meses` da data inicial,
+    usando o prazo comercial (meses * 30 dias). Prazos não positivos são
+    ignorados, como no cálculo original por datas.
+
+    `taxa_diaria` pode ser um array: o resultado terá o mesmo formato dele.
+    """
+    meses = np.asarray(meses, dtype=np.float64)
+    taxa_diaria = np.asarray(taxa_diaria, dtype=np.float64)
+    if meses.size == 0:
+        return _escalar_ou_array(np.zeros_like(taxa_diaria))
+
+    dias = meses * DIAS_POR_MES
+    fatores = np.where(dias > 0, (1 + taxa_diaria[..., None]) ** -dias, 0.0)
+    soma = fatores.sum(axis=-1)
+    # Taxa zero: cada vencimento vale 1 (mesma regra de calcular_fator_vp)
+    return _escalar_ou_array(np.where(taxa_diaria <= 0, float(meses.size), soma))
+
+
+def meses_comerciais(datas_vencimento, data_inicio):
+    """
+    Converte datas de vencimento (datetime ou 'dd/mm/aaaa') no número de meses
+    contados a partir de `data_inicio`.
+    """
+    datas = [datetime.strptime(d, '%d/%m/%Y') if isinstance(d, str) else d for d in datas_vencimento]
+    if not datas:
+        return np.zeros(0, dtype=np.int64)
+    meses_venc = np.asarray(datas, dtype='datetime64[M]').astype(np.int64)
+    mes_inicio = np.datetime64(data_inicio, 'M').astype(np.int64)
+    return meses_venc - mes_inicio
+
+
+def calcular_fator_vp(datas_vencimento, data_inicio, taxa_diaria):
+    """
+    Calcula o fator de valor presente somado para uma lista de datas, usando
+    prazo comercial.
+    """
+    if taxa_diaria <= 0:
+        return float(len(datas_vencimento))
+    return fator_vp_meses(meses_comerciais(datas_vencimento, data_inicio), taxa_diaria)
+
+
+# --- Fatores de Anuidade (Forma Fechada) ---
+
+def fator_serie(taxa_diaria, qtd, passo_meses=1, primeiro_mes=None):
+    """
+    Fator de valor presente de `qtd` vencimentos igualmente espaçados, a cada
+    `passo_meses` meses a partir de `primeiro_mes` (padrão: o próprio passo).
+
+    Como o prazo comercial é sempre meses * 30 dias, a série é uma progressão
+    geométrica e a soma sai em O(1), sem montar a lista de datas. O resultado
+    equivale a calcular_fator_vp sobre as datas de ajustar_data_vencimento.
+    `taxa_diaria` e `qtd` podem ser arrays (com broadcasting).
+    """
+    if primeiro_mes is None:
+        primeiro_mes = passo_meses
+    taxa_diaria = np.asarray(taxa_diaria, dtype=np.float64)
+    qtd = np.maximum(np.asarray(qtd, dtype=np.float64), 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        razao = (1 + taxa_diaria) ** (-DIAS_POR_MES * passo_meses)
+        primeiro_fator = (1 + taxa_diaria) ** (-DIAS_POR_MES * primeiro_mes)
+        soma = primeiro_fator * (1 - razao ** qtd) / (1 - razao)
+
+    # Taxa zero: cada vencimento vale 1 (mesma regra de calcular_fator_vp)
+    fator = np.where(taxa_diaria <= 0, qtd, soma)
+    return _escalar_ou_array(np.where(qtd > 0, fator, 0.0))
+
+
+def fator_anuidade(taxa_diaria, qtd, espacamento="mensal", tipo_balao="anual"):
+    """
+    Fator de valor presente de uma série regular, em O(1).
+
+    `espacamento` pode ser "mensal", "semestral" ou "anual" (`qtd` vencimentos
+    no período indicado) ou "mensal + balão": nesse caso `qtd` é o número de
+    parcelas mensais e o retorno é o par (fator das parcelas, fator dos
+    balões), com um balão a cada 12 ou 6 meses (`tipo_balao`) dentro do prazo.
+    """
+    if espacamento == "mensal + balão":
+        intervalo = MESES_POR_PERIODO["anual" if tipo_balao == "anual" else "semestral"]
+        qtd_baloes = np.asarray(qtd) // intervalo
+        return fator_serie(taxa_diaria, qtd, 1), fator_serie(taxa_diaria, qtd_baloes, intervalo)
+    if espacamento not in MESES_POR_PERIODO:
+        raise ValueError(f"Espaçamento desconhecido: {espacamento}")
+    return fator_serie(taxa_diaria, qtd, MESES_POR_PERIODO[espacamento])
+
+
+# --- Cache de Fatores (Independente da Data) ---
+# Com o prazo comercial (meses * 30), o fator de uma série regular depende só
+# da taxa mensal, da quantidade de vencimentos e do espaçamento — nunca da data
+# de início. Um único cache por processo atende todas as sessões, dias e
+# empreendimentos; o limite de entradas segura a memória quando a taxa vem
+# digitada pelo usuário (cada fator custa O(1) para recalcular).
+TAMANHO_CACHE_FATORES = 4096
+
+
+@lru_cache(maxsize=TAMANHO_CACHE_FATORES)
+def _fator_serie_por_chave(taxa_mensal_percentual, qtd, passo_meses):
+    taxa_diaria = calcular_taxas(taxa_mensal_percentual)['diaria']
+    return fator_serie(taxa_diaria, qtd, passo_meses)
+
+
+def _fator_serie_cacheado(taxa_mensal_percentual, qtd, passo_meses):
+    return _fator_serie_por_chave(round(float(taxa_mensal_percentual), 6), int(qtd), int(passo_meses))
+
+
+def fator_anuidade_cacheado(taxa_mensal_percentual, qtd, espacamento="mensal", tipo_balao="anual"):
+    """
+    Mesmo contrato de fator_anuidade, mas recebendo a taxa mensal em percentual
+    e reaproveitando o cache de fatores do processo.
+    """
+    if espacamento == "mensal + balão":
+        intervalo = MESES_POR_PERIODO["anual" if tipo_balao == "anual" else "semestral"]
+        return (_fator_serie_cacheado(taxa_mensal_percentual, qtd, 1),
+                _fator_serie_cacheado(taxa_mensal_percentual, int(qtd) // intervalo, intervalo))
+    if espacamento not in MESES_POR_PERIODO:
+        raise ValueError(f"Espaçamento desconhecido: {espacamento}")
+    return _fator_serie_cacheado(taxa_mensal_percentual, qtd, MESES_POR_PERIODO[espacamento])
+
+
+def limpar_cache_fatores():
+    """Esvazia o cache de fatores do processo."""
+    _fator_serie_por_chave.cache_clear()
+
+
+# --- Datas de Vencimento ---
+
+def meses_vencimento(periodo, qtd, primeiro_mes=None):
+    """
+    Prazos, em meses a partir da data base, de `qtd` vencimentos a cada
+    `periodo` (mensal, semestral ou anual). Sem `primeiro_mes`, o primeiro
+    vencimento cai um período após a data base.
+
+    Cobre também o encadeamento "a partir do 1º vencimento": como o dia de
+    vencimento é sempre reaplicado sobre o mês, somar um período à data
+    anterior equivale a somar k períodos ao prazo do primeiro vencimento.
+    """
+    passo = MESES_POR_PERIODO.get(periodo, 0)
+    if primeiro_mes is None:
+        primeiro_mes = passo
+    return primeiro_mes + np.arange(max(int(qtd or 0), 0), dtype=np.int64) * passo
+
+
+def datas_vencimento(data_base, meses, dia_vencimento=None):
+    """
+    Datas de vencimento (datetime64[D]) a `meses` da data base, todas de uma
+    vez. Se o dia não existir no mês de destino, usa o último dia do mês.
+    """
+    dia = data_base.day if dia_vencimento is None else dia_vencimento
+    meses_destino = np.datetime64(data_base, 'M') + np.asarray(meses, dtype=np.int64)
+    inicio_do_mes = meses_destino.astype('datetime64[D]')
+    dias_no_mes = ((meses_destino + 1).astype('datetime64[D]') - inicio_do_mes).astype(np.int64)
+    return inicio_do_mes + (np.minimum(dia, dias_no_mes) - 1)
+
+
+def formatar_datas(datas):
+    """Formata um array datetime64[D] como 'dd/mm/aaaa'."""
+    return pd.DatetimeIndex(datas).strftime('%d/%m/%Y').tolist()
+
+
+def _centavos(valores):
+    """
+    Valores absolutos em centavos inteiros, arredondados como o format do
+    Python ("{:.2f}"): pelo valor exato do float, não pelo produto por 100.
+    Só os empates aparentes (x,5 centavos) precisam do erro do produto, que
+    sai exato separando o valor em duas metades (Veltkamp/Dekker).
+    """
+    valores = np.abs(valores)
+    produto = valores * 100
+    centavos = np.rint(produto)
+    empates = (produto - np.floor(produto)) == 0.5
+    if empates.any():
+        x = valores[empates]
+        t = x * (2.0 ** 27 + 1)
+        alto = t - (t - x)
+        erro = (alto * 100 - produto[empates]) + (x - alto) * 100
+        p = produto[empates]
+        centavos[empates] = np.where(erro > 0, np.ceil(p), np.where(erro < 0, np.floor(p), centavos[empates]))
+    return centavos.astype(np.int64)
+
+
+def formatar_moedas(valores, simbolo=True):
+    """
+    Formata uma coluna de valores como moeda BR ("R$ 1.234,56") de uma vez,
+    com o mesmo arredondamento de f"{valor:,.2f}"; NaN vira 0,00. Devolve uma
+    lista de strings do mesmo tamanho.
+    """
+    valores = np.nan_to_num(np.asarray(valores, dtype=np.float64).ravel())
+    if not valores.size:
+        return []
+    inteiros, resto = np.divmod(_centavos(valores), 100)
+
+    # Grupos de milhar com três dígitos, juntados por "." e sem os zeros à esquerda
+    qtd_grupos = len(str(int(inteiros.max()))) // 3 + 1
+    texto = np.strings.zfill((inteiros % 1000).astype(np.str_), 3)
+    for _ in range(qtd_grupos - 1):
+        inteiros = inteiros // 1000
+        texto = np.strings.add(np.strings.add(np.strings.zfill((inteiros % 1000).astype(np.str_), 3), "."), texto)
+    texto = np.strings.lstrip(texto, "0.")
+    texto = np.where(np.strings.str_len(texto) == 0, "0", texto)
+
+    texto = np.strings.add(np.strings.add(texto, ","), np.strings.zfill(resto.astype(np.str_), 2))
+    texto = np.where(valores < 0, np.strings.add("-", texto), texto)
+    if simbolo:
+        texto = np.strings.add("R$ ", texto)
+    return texto.tolist()
+
+
+def ajustar_data_vencimento(data_base, periodo, num_periodo=1, dia_vencimento=None):
+    """
+    Calcula uma data futura com base em um período (mensal, semestral, anual).
+    Se o dia não existir no mês de destino, usa o último dia do mês.
+    """
+    if not isinstance(data_base, datetime):
+        data_base = datetime.combine(data_base, datetime.min.time())
+    months_to_add = MESES_POR_PERIODO.get(periodo, 0) * num_periodo
+    try:
+        data = datas_vencimento(data_base, [months_to_add], dia_vencimento)[0].astype(datetime)
+        return datetime.combine(data, datetime.min.time())
+    except Exception:
+        return data_base + timedelta(days=30 * (months_to_add or num_periodo))
+
+
+# --- Cronograma ---
+TIPOS_VENCIMENTO = np.array(["Parcela", "Balão"])
+PARCELA, BALAO = 0, 1
+
+
+class Cronograma:
+    """
+    Cronograma em formato colunar: um array por coluna (tipo, número, prazo em
+    meses, valor, valor presente e desconto). Rótulos e datas são formatados só
+    quando alguém pede por eles (PDF ou Excel) e depois reaproveitados.
+    """
+    COLUNAS = ["Item", "Tipo", "Data_Vencimento", "Dias", "Valor", "Valor_Presente", "Desconto_Aplicado"]
+
+    def __init__(self, data_entrada, tipos, numeros, meses, valores, valores_presentes, descontos,
+                 valor_presente_total=None):
+        self.data_entrada = data_entrada
+        self.tipos = tipos                          # PARCELA ou BALAO (int8)
+        self.numeros = numeros                      # número dentro do tipo (Parcela 1, Balão 1...)
+        self.meses = meses                          # prazo em meses a partir da entrada
+        self.valores = valores                      # float64, em centavos arredondados
+        self.valores_presentes = valores_presentes
+        self.descontos = descontos
+        self.valor_presente_total = valor_presente_total
+
+    def __len__(self):
+        return int(self.meses.size)
+
+    @property
+    def dias(self):
+        return self.meses * DIAS_POR_MES
+
+    @cached_property
+    def rotulos_tipo(self):
+        return TIPOS_VENCIMENTO[self.tipos].tolist()
+
+    @cached_property
+    def itens(self):
+        return [f"{tipo} {numero}" for tipo, numero in zip(self.rotulos_tipo, self.numeros.tolist())]
+
+    @cached_property
+    def datas(self):
+        return datas_vencimento(self.data_entrada, self.meses)
+
+    @cached_property
+    def datas_vencimento(self):
+        return formatar_datas(self.datas)
+
+    @cached_property
+    def valores_em_texto(self):
+        """Valor, valor presente e desconto já formatados ("1.234,56"), coluna a coluna."""
+        return tuple(formatar_moedas(coluna, simbolo=False)
+                     for coluna in (self.valores, self.valores_presentes, self.descontos))
+
+    @cached_property
+    def assinatura(self):
+        """
+        Hash do conteúdo do cronograma: identifica o mesmo cronograma entre
+        reruns, por exemplo para reaproveitar exportações já geradas.
+        """
+        h = hashlib.sha1()
+        for coluna in (self.tipos, self.numeros, self.meses, self.valores, self.valores_presentes, self.descontos):
+            h.update(np.ascontiguousarray(coluna).tobytes())
+        h.update(repr((self.data_entrada, self.valor_presente_total)).encode())
+        return h.hexdigest()
+
+    @cached_property
+    def total(self):
+        """
+        Linha de totais (chaves Valor, Valor_Presente e Desconto_Aplicado) ou
+        None para cronograma vazio.
+        """
+        if not len(self):
+            return None
+        total_valor = round(float(self.valores.sum()), 2)
+        valor_presente_total = self.valor_presente_total
+        if valor_presente_total is None:
+            valor_presente_total = round(float(self.valores_presentes.sum()), 2)
+        return {
+            "Item": "TOTAL", "Tipo": "", "Data_Vencimento": "", "Dias": "",
+            "Valor": total_valor,
+            "Valor_Presente": valor_presente_total,
+            "Desconto_Aplicado": round(total_valor - valor_presente_total, 2),
+        }
+
+    def _reordenar(self, indices):
+        return Cronograma(
+            self.data_entrada, self.tipos[indices], self.numeros[indices], self.meses[indices],
+            self.valores[indices], self.valores_presentes[indices], self.descontos[indices],
+            valor_presente_total=self.valor_presente_total
+        )
+
+    def agrupado(self):
+        """
+        Visão agrupada do cronograma: todas as parcelas e depois todos os
+        balões, cada grupo em ordem de vencimento.
+        """
+        return self._reordenar(np.argsort(self.tipos, kind='stable'))
+
+    def linhas(self):
+        """
+        Itera (item, tipo, data, valor, valor presente, desconto) por vencimento,
+        para exportações que escrevem linha a linha.
+        """
+        return zip(self.itens, self.rotulos_tipo, self.datas_vencimento, self.valores.tolist(),
+                   self.valores_presentes.tolist(), self.descontos.tolist())
+
+    def linhas_em_texto(self):
+        """Como `linhas`, mas com os valores já formatados, para o PDF."""
+        return zip(self.itens, self.rotulos_tipo, self.datas_vencimento, *self.valores_em_texto)
+
+    def para_dataframe(self, incluir_total=False):
+        """
+        DataFrame com as colunas do cronograma, montado direto dos arrays.
+        """
+        df = pd.DataFrame({
+            "Item": self.itens, "Tipo": self.rotulos_tipo,
+            "Data_Vencimento": self.datas_vencimento, "Dias": self.dias,
+            "Valor": self.valores, "Valor_Presente": self.valores_presentes,
+            "Desconto_Aplicado": self.descontos,
+        }, columns=self.COLUNAS)
+        if incluir_total and len(self):
+            df = pd.concat([df, pd.DataFrame([self.total])], ignore_index=True)
+        return df
+
+    def para_exibicao(self):
+        """
+        DataFrame para a tela: mesmas colunas de para_dataframe, mas com datas
+        e valores nos tipos originais (colunas Arrow numéricas). A formatação
+        fica com o column_config do st.dataframe, e a tabela pode ser
+        ordenada pelo navegador.
+        """
+        return pd.DataFrame({
+            "Item": self.itens, "Tipo": self.rotulos_tipo,
+            "Data_Vencimento": self.datas, "Dias": self.dias,
+            "Valor": self.valores, "Valor_Presente": self.valores_presentes,
+            "Desconto_Aplicado": self.descontos,
+        }, columns=self.COLUNAS)
+
+
+def mesclar_por_prazo(meses_parcelas, meses_baloes):
+    """
+    Posições finais de parcelas e balões na intercalação cronológica, dadas
+    as duas listas de prazos (em meses) já ordenadas. A mescla é estável: no
+    mesmo mês, a parcela vem antes do balão.
+    """
+    meses_parcelas = np.asarray(meses_parcelas, dtype=np.int64)
+    meses_baloes = np.asarray(meses_baloes, dtype=np.int64)
+    pos_parcelas = np.arange(meses_parcelas.size) + np.searchsorted(meses_baloes, meses_parcelas, side='left')
+    pos_baloes = np.arange(meses_baloes.size) + np.searchsorted(meses_parcelas, meses_baloes, side='right')
+    return pos_parcelas, pos_baloes
+
+
+def montar_cronograma(data_entrada, taxa_diaria, meses_parcelas=(), valores_parcelas=(),
+                      meses_baloes=(), valores_baloes=(), valor_presente_total=None,
+                      ordem="cronologica"):
+    """
+    Monta o Cronograma a partir dos prazos, em meses, e dos valores de cada
+    parcela e balão. O desconto a valor presente é calculado de uma só vez
+    para todos os vencimentos.
+
+    Por padrão parcelas e balões saem intercalados por vencimento
+    (`ordem="cronologica"`); `ordem="agrupada"` lista as parcelas e depois os
+    balões. Sem `valor_presente_total`, o VP do TOTAL é a soma dos VPs das linhas.
+    """
+    if not isinstance(data_entrada, datetime):
+        data_entrada = datetime.combine(data_entrada, datetime.min.time())
+
+    meses_p = np.asarray(meses_parcelas, dtype=np.int64)
+    meses_b = np.asarray(meses_baloes, dtype=np.int64)
+    valores_p = np.broadcast_to(np.asarray(valores_parcelas, dtype=np.float64), meses_p.shape)
+    valores_b = np.broadcast_to(np.asarray(valores_baloes, dtype=np.float64), meses_b.shape)
+
+    # Cada grupo em ordem de vencimento, preservando a numeração original
+    ordem_p = np.argsort(meses_p, kind='stable')
+    ordem_b = np.argsort(meses_b, kind='stable')
+    pos_p, pos_b = mesclar_por_prazo(meses_p[ordem_p], meses_b[ordem_b])
+
+    total_linhas = meses_p.size + meses_b.size
+    tipos = np.empty(total_linhas, dtype=np.int8)
+    numeros = np.empty(total_linhas, dtype=np.int64)
+    meses = np.empty(total_linhas, dtype=np.int64)
+    valores = np.empty(total_linhas, dtype=np.float64)
+    for pos, tipo, ordem_grupo, meses_grupo, valores_grupo in (
+            (pos_p, PARCELA, ordem_p, meses_p, valores_p), (pos_b, BALAO, ordem_b, meses_b, valores_b)):
+        tipos[pos] = tipo
+        numeros[pos] = ordem_grupo + 1
+        meses[pos] = meses_grupo[ordem_grupo]
+        valores[pos] = valores_grupo[ordem_grupo]
+
+    valores_presentes = np.atleast_1d(calcular_valor_presente(valores, taxa_diaria, meses * DIAS_POR_MES))
+    descontos = np.round(valores - valores_presentes, 2)
+
+    cronograma = Cronograma(
+        data_entrada, tipos, numeros, meses,
+        np.round(valores, 2), np.round(valores_presentes, 2), descontos,
+        valor_presente_total=valor_presente_total
+    )
+    return cronograma.agrupado() if ordem == "agrupada" else cronograma
+
+
+def gerar_cronograma(valor_financiado, valor_parcela_final, valor_balao_final,
+                     qtd_parcelas, qtd_baloes, modalidade, tipo_balao,
+                     data_entrada, taxas, valor_primeira_parcela=None, valor_primeiro_balao=None):
+    """
+    Cronograma padrão dos simuladores (mensal, mensal + balão e só balão), com
+    ajuste opcional na primeira parcela/balão. O VP total é o próprio valor
+    financiado, para evitar diferenças de arredondamento.
+    """
+    meses_p = np.zeros(0, dtype=np.int64)
+    meses_b = np.zeros(0, dtype=np.int64)
+
+    if modalidade in ["mensal", "mensal + balão"]:
+        meses_p = meses_vencimento("mensal", qtd_parcelas)
+
+    periodo_balao_map = {"só balão anual": "anual", "só balão semestral": "semestral"}
+    if modalidade in periodo_balao_map:
+        meses_b = meses_vencimento(periodo_balao_map[modalidade], qtd_baloes)
+    elif modalidade == "mensal + balão":
+        intervalo = 12 if tipo_balao == "anual" else 6
+        meses_b = np.arange(intervalo, qtd_parcelas + 1, intervalo)[:max(qtd_baloes, 0)]
+
+    valores_p = np.full(meses_p.size, valor_parcela_final, dtype=np.float64)
+    valores_b = np.full(meses_b.size, valor_balao_final, dtype=np.float64)
+    if valor_primeira_parcela is not None and valores_p.size:
+        valores_p[0] = valor_primeira_parcela
+    if valor_primeiro_balao is not None and valores_b.size:
+        valores_b[0] = valor_primeiro_balao
+
+    return montar_cronograma(
+        data_entrada, taxas['diaria'], meses_p, valores_p, meses_b, valores_b,
+        valor_presente_total=valor_financiado
+    )
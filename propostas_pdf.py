@@ -0,0 +1,170 @@
+# propostas_pdf.py
+"""
+Propostas em PDF dos planos oficiais, no mesmo layout da exportação do
+appcorretores.py, e a geração em lote dos cadernos de proposta: um PDF por
+lote com todos os PLANOS_DISPONIVEIS, para uma quadra ou para a planilha
+inteira, gravados num ZIP.
+
+Não depende do Streamlit. Pela linha de comando:
+
+    python propostas_pdf.py Lotes.xlsx --quadra 01 -o Propostas_QD01.zip
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+
+import numpy as np
+from fpdf import FPDF
+
+from catalogo_lotes import ler_planilha_lotes, normalizar_codigo
+from motor_financeiro import calcular_taxas, montar_cronograma
+from regras_comerciais import PLANOS_DISPONIVEIS, extrair_dados_plano
+from relatorio_pdf import ModeloRelatorio, formatar_valor
+from tabela_vendas import gerar_tabelas_por_plano, pre_calcular_fatores
+
+# --- Layout da Proposta ---
+@lru_cache(maxsize=None)
+def modelo_proposta():
+    """Modelo do PDF da proposta, montado uma vez por processo."""
+    return ModeloRelatorio(colunas=["Item", "Tipo", "Data Venc.", "Valor", "Valor Presente", "Juros"],
+                           fonte_cabecalho=11, espaco_tabela=5)
+
+def secoes_proposta(dados):
+    moeda = lambda valor: f"R$ {formatar_valor(valor)}"
+    return [
+        ("Informações do Imóvel", [f"Quadra: {dados.get('quadra', 'N/I')} | Lote: {dados.get('lote', 'N/I')} | Metragem: {dados.get('metragem', 'N/I')} m²"]),
+        ("Simulação de Financiamento - Imobiliária Celeste", [
+            f"Plano Escolhido: {dados['nome_plano']}",
+            f"Valor Total do Imóvel: {moeda(dados['valor_total'])}",
+            f"Entrada Total: {moeda(dados['entrada'])}",
+            f"Valor Financiado: {moeda(dados['valor_financiado'])}",
+            f"Taxa Mensal Utilizada: {dados['taxa_mensal']:.3f}%",
+        ]),
+    ]
+
+def gerar_proposta(cronograma, dados):
+    """PDF (bytes) de uma proposta: dados do imóvel e do plano e o cronograma."""
+    return modelo_proposta().gerar(cronograma, secoes_proposta(dados))
+
+def cronograma_plano(data_base, taxa_mensal, qtd_parcelas, valor_parcela, qtd_baloes, valor_balao, intervalo_baloes=12):
+    """Cronograma de um plano: parcelas mensais e balões a cada `intervalo_baloes` meses."""
+    meses_b = np.arange(intervalo_baloes, qtd_parcelas + 1, intervalo_baloes)[:qtd_baloes] if qtd_baloes > 0 else []
+    return montar_cronograma(data_base, calcular_taxas(taxa_mensal)['diaria'], np.arange(1, qtd_parcelas + 1),
+                             valor_parcela, meses_b, valor_balao)
+
+# --- Cadernos por Lote ---
+def _planos_por_lote(df_lotes):
+    """
+    Valores de todos os planos para cada lote, saídos da mesma conta
+    matricial da tabela de vendas. Gera (quadra, lote, metragem, valor à
+    vista, [(plano, taxa, entrada, financiado, qtd_p, parcela, qtd_b, balão), ...]).
+    """
+    tabelas = list(gerar_tabelas_por_plano(df_lotes).values())
+    if not tabelas or tabelas[0].empty: return
+    planos = list(pre_calcular_fatores())
+
+    colunas_planos = []
+    for plano, tabela in zip(planos, tabelas):
+        qtd_b = tabela['Qtd Balões'].tolist() if 'Qtd Balões' in tabela else [0] * len(tabela)
+        balao = tabela['Valor do Balão'].tolist() if 'Valor do Balão' in tabela else [0.0] * len(tabela)
+        colunas_planos.append(zip(
+            [plano] * len(tabela), [extrair_dados_plano(plano)[3]] * len(tabela),
+            tabela['Entrada Comercial (A Vista)'].tolist(), tabela['Saldo Financiado'].tolist(),
+            tabela['Qtd Parcelas'].tolist(), tabela['Valor da Parcela'].tolist(), qtd_b, balao,
+        ))
+
+    base = tabelas[0]
+    lotes = zip(base['Quadra'].tolist(), base['Lote'].tolist(), base['M²'].tolist(), base['Valor à Vista'].tolist())
+    for (quadra, lote, metragem, valor_vista), *valores_planos in zip(lotes, *colunas_planos):
+        yield quadra, lote, metragem, valor_vista, valores_planos
+
+def gerar_caderno(quadra, lote, metragem, valor_vista, valores_planos, data_base):
+    """
+    Caderno de propostas de um lote: um PDF com uma proposta por plano.
+    Devolve (nome do arquivo, bytes do PDF, páginas).
+    """
+    modelo = modelo_proposta()
+    pdf = FPDF()
+    for plano, taxa, entrada, financiado, qtd_p, parcela, qtd_b, balao in valores_planos:
+        cronograma = cronograma_plano(data_base, taxa, qtd_p, parcela, qtd_b, balao)
+        dados = {
+            'valor_total': valor_vista, 'entrada': entrada, 'taxa_mensal': taxa,
+            'valor_financiado': financiado, 'quadra': quadra, 'lote': lote,
+            'metragem': metragem, 'nome_plano': plano,
+        }
+        modelo.desenhar(pdf, cronograma, secoes_proposta(dados))
+    return f"QD{quadra}/Proposta_QD{quadra}_LT{lote}.pdf", bytes(pdf.output()), pdf.page_no()
+
+def _gerar_caderno_tarefa(args):
+    return gerar_caderno(*args)
+
+def gerar_cadernos(df_lotes, destino, data_base=None, quadra=None, trabalhadores=1, progresso=None):
+    """
+    Gera os cadernos de proposta (um PDF por lote, todos os planos) e grava
+    cada um no ZIP `destino` assim que fica pronto, sem acumular os PDFs em
+    memória. Com `quadra`, só os lotes dela.
+
+    Com `trabalhadores` > 1 os cadernos são gerados num pool de processos.
+    `progresso(feitos, total, segundos)` é chamado a cada caderno gravado.
+    Devolve um dicionário com lotes, propostas, páginas, bytes e segundos.
+    """
+    data_base = data_base or datetime.combine(datetime.now(), datetime.min.time())
+    if quadra is not None:
+        df_lotes = df_lotes[df_lotes['Quadra'] == normalizar_codigo(quadra)]
+    tarefas = [(*lote, data_base) for lote in _planos_por_lote(df_lotes)]
+
+    inicio = time.perf_counter()
+    resumo = {'lotes': 0, 'propostas': 0, 'paginas': 0, 'bytes': 0}
+    with zipfile.ZipFile(destino, 'w', zipfile.ZIP_STORED) as pacote:
+        if trabalhadores and trabalhadores > 1 and len(tarefas) > 1:
+            pool = ProcessPoolExecutor(max_workers=trabalhadores, mp_context=multiprocessing.get_context('spawn'))
+            lote_envio = max(1, len(tarefas) // (trabalhadores * 8))
+            cadernos = pool.map(_gerar_caderno_tarefa, tarefas, chunksize=lote_envio)
+        else:
+            pool = None
+            cadernos = map(_gerar_caderno_tarefa, tarefas)
+        try:
+            for nome_arquivo, conteudo, paginas in cadernos:
+                pacote.writestr(nome_arquivo, conteudo)
+                resumo['lotes'] += 1
+                resumo['paginas'] += paginas
+                resumo['bytes'] += len(conteudo)
+                if progresso: progresso(resumo['lotes'], len(tarefas), time.perf_counter() - inicio)
+        finally:
+            if pool: pool.shutdown(cancel_futures=True)
+
+    resumo['propostas'] = resumo['lotes'] * len(PLANOS_DISPONIVEIS)
+    resumo['segundos'] = time.perf_counter() - inicio
+    return resumo
+
+# --- LINHA DE COMANDO ---
+def _mostrar_progresso(feitos, total, segundos):
+    vazao = feitos / segundos if segundos > 0 else 0
+    print(f"\r{feitos}/{total} lotes ({vazao:,.1f} lotes/s)", end="" if feitos < total else "\n", file=sys.stderr, flush=True)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera os cadernos de proposta em PDF (um por lote, com todos os planos oficiais) num arquivo ZIP.")
+    parser.add_argument("planilha", help="Planilha de lotes (.xlsx ou .csv) com IDENTIFICADOR, Área em Metro Quadrado e Valor a Vista")
+    parser.add_argument("-q", "--quadra", help="Gera só os lotes desta quadra (padrão: todas)")
+    parser.add_argument("-d", "--data-base", help="Data de início do contrato, DD/MM/AAAA (padrão: hoje)")
+    parser.add_argument("-o", "--saida", help="Arquivo .zip de saída (padrão: Propostas_Celeste_<data>.zip)")
+    parser.add_argument("-j", "--trabalhadores", type=int, default=os.cpu_count() or 1, help="Processos gerando PDFs em paralelo (padrão: núcleos da máquina; 1 = sequencial)")
+    args = parser.parse_args(argv)
+    data_base = datetime.strptime(args.data_base, "%d/%m/%Y") if args.data_base else None
+    saida = args.saida or f"Propostas_Celeste_{datetime.now().strftime('%d-%m-%Y')}.zip"
+
+    df_lotes = ler_planilha_lotes(args.planilha)
+    resumo = gerar_cadernos(df_lotes, saida, data_base, args.quadra, args.trabalhadores, _mostrar_progresso)
+
+    segundos = resumo['segundos'] or float('nan')
+    print(f"{resumo['lotes']} cadernos ({resumo['propostas']} propostas, {resumo['paginas']} páginas) gravados em {saida} ({resumo['bytes'] / 2**20:,.1f} MiB)")
+    print(f"Tempo: {resumo['segundos']:.2f} s | Vazão: {resumo['propostas'] / segundos:,.1f} propostas/s, {resumo['paginas'] / segundos:,.0f} páginas/s")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,267 @@
+# regras_comerciais.py
+"""
+Regras comerciais da Celeste (faixas de taxa por prazo, entrada padrão,
+parcela dos balões e planos oficiais) e a simulação em lote das propostas do
+simulador.py, com as faixas de cada empreendimento.
+
+Como o motor financeiro, o módulo não depende do Streamlit: serve tanto aos
+apps quanto a scripts e notebooks que avaliam milhares de cenários de uma vez.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from motor_financeiro import MESES_POR_PERIODO, calcular_taxas, fator_serie
+
+# --- Faixas por Prazo ---
+class TabelaFaixas:
+    """
+    Faixas por prazo declaradas como dados e compiladas uma vez em arrays
+    ordenados, consultados com busca binária (np.searchsorted) para qualquer
+    quantidade de prazos de uma vez.
+
+    `faixas` é uma lista [(prazo final da faixa, valor), ...] em ordem
+    crescente, começando no prazo 1, ou um dicionário {grupo: lista} para
+    compilar vários grupos (empreendimentos) numa única tabela. Prazos abaixo
+    de 1 valem `valor_abaixo` e acima da última faixa, `valor_acima`.
+    """
+
+    def __init__(self, faixas, valor_abaixo=0.0, valor_acima=0.0):
+        grupos = faixas if isinstance(faixas, dict) else {None: faixas}
+        self.grupos = {grupo: i for i, grupo in enumerate(grupos)}
+        nomes = np.array([str(grupo) for grupo in grupos])
+        ordem = np.argsort(nomes)
+        self._nomes_ordenados, self._codigos_ordenados = nomes[ordem], ordem.astype(np.int64)
+        # Cada grupo ocupa um trecho [i * passo, (i + 1) * passo) da chave, com
+        # uma margem para os prazos abaixo e acima das faixas
+        self.passo = max(prazo for lista in grupos.values() for prazo, _ in lista) + 2
+        limites, valores = [], []
+        for i, lista in enumerate(grupos.values()):
+            prazos = [prazo for prazo, _ in lista]
+            if prazos != sorted(prazos) or prazos[0] < 1:
+                raise ValueError(f"Faixas fora de ordem: {lista}")
+            base = i * self.passo
+            limites += [base] + [base + prazo for prazo in prazos] + [base + self.passo - 1]
+            valores += [valor_abaixo] + [valor for _, valor in lista] + [valor_acima]
+        self.limites = np.array(limites, dtype=np.int64)
+        self.valores = np.array(valores, dtype=np.float64)
+
+    def codigos(self, grupos):
+        """Código inteiro de cada grupo (aceita um nome ou um array de nomes)."""
+        grupos = np.asarray(grupos)
+        if grupos.ndim == 0:
+            return self.grupos[grupos.item()]
+        # Busca binária nos nomes ordenados, como nas faixas
+        posicoes = np.minimum(np.searchsorted(self._nomes_ordenados, grupos), len(self._nomes_ordenados) - 1)
+        desconhecidos = self._nomes_ordenados[posicoes] != grupos
+        if desconhecidos.any():
+            raise KeyError(f"Grupo sem faixas: {grupos[desconhecidos][0]}")
+        return self._codigos_ordenados[posicoes]
+
+    def __call__(self, prazos, grupos=None):
+        """
+        Valor da faixa de cada prazo. `grupos` (nomes ou códigos, escalar ou
+        array, com broadcasting) escolhe as faixas nas tabelas com vários grupos.
+        """
+        prazos = np.clip(np.asarray(prazos), 0, self.passo - 1)
+        if grupos is None:
+            codigo = 0
+        elif np.issubdtype(np.asarray(grupos).dtype, np.integer):
+            codigo = np.asarray(grupos)
+        else:
+            codigo = self.codigos(grupos)
+        chaves = codigo * self.passo + prazos
+        valor = self.valores[np.searchsorted(self.limites, chaves, side='left')]
+        return float(valor) if valor.ndim == 0 else valor
+
+
+# --- Regras Comerciais ---
+PRAZO_MAXIMO = 156
+PCT_VP_BALOES = 0.47  # Balões carregam 47% do valor à vista (a valor presente)
+
+# Até 36x sem juros, 37-48x 0,395%, 49-60x 0,59% e 61-156x 0,79%; fora das faixas, 0%
+FAIXAS_TAXA = [(36, 0.0), (48, 0.395), (60, 0.59), (PRAZO_MAXIMO, 0.79)]
+# Entrada padrão: até 60x = 10%, acima de 60x = 6%
+FAIXAS_ENTRADA = [(60, 0.10)]
+
+TAXAS_POR_PRAZO = TabelaFaixas(FAIXAS_TAXA)
+ENTRADAS_POR_PRAZO = TabelaFaixas(FAIXAS_ENTRADA, valor_abaixo=0.10, valor_acima=0.06)
+
+
+def taxa_mensal_por_prazo(qtd_parcelas):
+    """Taxa mensal (%) da faixa de prazo (FAIXAS_TAXA). Aceita arrays."""
+    return TAXAS_POR_PRAZO(qtd_parcelas)
+
+
+def pct_entrada_por_prazo(qtd_parcelas):
+    """Percentual de entrada padrão do prazo (FAIXAS_ENTRADA). Aceita arrays."""
+    return ENTRADAS_POR_PRAZO(qtd_parcelas)
+
+
+# --- Planos Oficiais ---
+PLANOS_DISPONIVEIS = [
+    "Plano de 24 Parcelas, 10% de entrada, parcelado em 03 vezes",
+    "Plano de 36 Parcelas, 10% de entrada, parcelado em 03 vezes",
+    "Plano de 48 Parcelas, 10% de entrada, parcelado em 03 vezes",
+    "Plano de 60 Parcelas, 10% de entrada, parcelado em 03 vezes",
+    "Plano de 72 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 84 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 96 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 108 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 120 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 132 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 144 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 156 Parcelas, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 72 Parcelas + 06 balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 84 Parcelas + 07 balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 96 Parcelas + 08 Balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 108 Parcelas + 09 Balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 120 Parcelas + 10 Balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 132 Parcelas + 11 Balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 144 Parcelas + 12 Balões, 06% de entrada, parcelado em 03 vezes",
+    "Plano de 156 Parcelas + 13 Balões, 06% de entrada, parcelado em 03 vezes"
+]
+
+
+def _ler_plano(plano_str):
+    match_p = re.search(r'(\d+)\s*[Pp]arcelas', plano_str)
+    qtd_parcelas = int(match_p.group(1)) if match_p else 0
+    match_b = re.search(r'(\d+)\s*[Bb]al[õo]es', plano_str, re.IGNORECASE)
+    qtd_baloes = int(match_b.group(1)) if match_b else 0
+    match_e = re.search(r'(\d+)%\s*de\s*entrada', plano_str)
+    pct_entrada = float(match_e.group(1))/100 if match_e else 0.10
+
+    taxa_mensal = taxa_mensal_por_prazo(qtd_parcelas)
+    return qtd_parcelas, qtd_baloes, pct_entrada, taxa_mensal
+
+
+# Os planos oficiais são lidos uma vez, na importação
+DADOS_PLANOS = {plano: _ler_plano(plano) for plano in PLANOS_DISPONIVEIS}
+
+
+def extrair_dados_plano(plano_str):
+    """
+    Quantidade de parcelas e de balões e percentual de entrada lidos do nome do
+    plano; a taxa mensal vem da faixa de prazo.
+    """
+    dados = DADOS_PLANOS.get(plano_str)
+    return dados if dados is not None else _ler_plano(plano_str)
+
+
+# --- Simulação em Lote ---
+COLUNAS_PROPOSTA = ["valor_total", "entrada", "qtd_parcelas", "modalidade", "tipo_balao",
+                    "valor_parcela", "valor_balao", "empreendimento"]
+MODALIDADES = ["mensal", "mensal + balão", "só balão anual", "só balão semestral"]
+
+
+def simular_propostas(valor_total, entrada=0.0, qtd_parcelas=0, modalidade="mensal", tipo_balao="anual",
+                      valor_parcela=0.0, valor_balao=0.0, empreendimento=None):
+    """
+    Simula várias propostas de uma vez, com as mesmas regras do formulário do
+    simulador.py: taxa pela faixa de prazo do empreendimento (cadastro de
+    empreendimentos.py) e, no plano mensal + balão, o valor informado da
+    parcela OU do balão define o outro pelo saldo a valor presente.
+
+    Os argumentos podem ser escalares ou arrays (com broadcasting). Também é
+    possível passar um DataFrame como primeiro argumento, com as colunas de
+    COLUNAS_PROPOSTA; colunas ausentes usam os padrões. Sem `empreendimento`,
+    vale o EMPREENDIMENTO_PADRAO.
+
+    `modalidade` é uma de MODALIDADES; `tipo_balao` ("anual" ou "semestral")
+    só vale para o mensal + balão. Propostas que o simulador recusaria (prazo
+    fora dos limites do empreendimento, valor financiado não positivo, mensal +
+    balão sem exatamente um dos valores, saldo negativo sem juros) saem com
+    NaN. Empreendimentos fora do cadastro levantam KeyError. Retorna um
+    DataFrame com uma linha por proposta, arredondado aos centavos.
+    """
+    # Importação local: empreendimentos.py usa a TabelaFaixas deste módulo
+    from empreendimentos import EMPREENDIMENTO_PADRAO, EMPREENDIMENTOS, TAXAS_POR_EMPREENDIMENTO
+
+    indice = None
+    if isinstance(valor_total, pd.DataFrame):
+        propostas = valor_total
+        indice = propostas.index
+        valor_total = propostas["valor_total"].to_numpy()
+        entrada = propostas["entrada"].to_numpy() if "entrada" in propostas else entrada
+        qtd_parcelas = propostas["qtd_parcelas"].to_numpy() if "qtd_parcelas" in propostas else qtd_parcelas
+        modalidade = propostas["modalidade"].to_numpy() if "modalidade" in propostas else modalidade
+        tipo_balao = propostas["tipo_balao"].to_numpy() if "tipo_balao" in propostas else tipo_balao
+        valor_parcela = propostas["valor_parcela"].to_numpy() if "valor_parcela" in propostas else valor_parcela
+        valor_balao = propostas["valor_balao"].to_numpy() if "valor_balao" in propostas else valor_balao
+        empreendimento = propostas["empreendimento"].to_numpy() if "empreendimento" in propostas else empreendimento
+    if empreendimento is None:
+        empreendimento = EMPREENDIMENTO_PADRAO
+
+    modalidades, posicoes = np.unique(np.asarray(modalidade, dtype=str), return_inverse=True)
+    desconhecidas = np.setdiff1d(modalidades, MODALIDADES)
+    if len(desconhecidas):
+        raise ValueError(f"Modalidade desconhecida: {desconhecidas[0]}")
+    modo = np.array([MODALIDADES.index(m) for m in modalidades], dtype=np.int64)[posicoes]
+
+    valor_total, entrada, qtd_p, modo, tipo_balao, informada, informado, codigo = np.broadcast_arrays(*map(np.atleast_1d, (
+        np.asarray(valor_total, dtype=np.float64),
+        np.asarray(entrada, dtype=np.float64),
+        np.asarray(qtd_parcelas, dtype=np.int64),
+        modo,
+        np.asarray(tipo_balao, dtype=str),
+        np.asarray(valor_parcela, dtype=np.float64),
+        np.asarray(valor_balao, dtype=np.float64),
+        TAXAS_POR_EMPREENDIMENTO.codigos(empreendimento),
+    )))
+    configs = list(EMPREENDIMENTOS.values())
+    prazo_minimo = np.array([config["prazo_minimo"] for config in configs])[codigo]
+    prazo_maximo = np.array([config["prazo_maximo"] for config in configs])[codigo]
+
+    taxa_mensal = TAXAS_POR_EMPREENDIMENTO(qtd_p, codigo)
+    valor_financiado = np.round(np.maximum(valor_total - entrada, 0), 2)
+    sem_juros = taxa_mensal == 0
+
+    # Balões como em simulador.atualizar_baloes
+    semestral = np.where(modo >= 2, modo == 3, tipo_balao == "semestral")
+    intervalo = np.where(semestral, MESES_POR_PERIODO["semestral"], MESES_POR_PERIODO["anual"])
+    qtd_b = np.select([modo == 1, modo >= 2], [qtd_p // intervalo, -(-qtd_p // intervalo)], 0)
+    qtd_p_pagas = np.where(modo >= 2, 0, qtd_p)  # Nos planos só balão não há parcelas mensais
+
+    taxa_diaria = calcular_taxas(taxa_mensal)['diaria']
+    fator_vp_p = np.asarray(fator_serie(taxa_diaria, qtd_p_pagas, 1))
+    fator_vp_b = np.asarray(fator_serie(taxa_diaria, qtd_b, intervalo))
+
+    # Mensal + balão: o valor informado fica e o outro paga o saldo a valor presente
+    calcula_balao = (modo == 1) & (informada > 0) & (informado == 0)
+    calcula_parcela = (modo == 1) & (informado > 0) & (informada == 0)
+    saldo = np.select(
+        [calcula_balao, calcula_parcela],
+        [valor_financiado - informada * fator_vp_p, valor_financiado - informado * fator_vp_b],
+        valor_financiado,
+    )
+    # Com juros o simulador zera o saldo negativo; sem juros, recusa a proposta
+    recusada = (modo == 1) & ~(calcula_balao | calcula_parcela) | sem_juros & (saldo < 0)
+    saldo = np.maximum(saldo, 0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valor_parcela = np.where(calcula_balao, informada, np.where(fator_vp_p > 0, np.round(saldo / fator_vp_p, 2), 0.0))
+        valor_balao = np.where(calcula_parcela, informado, np.where(fator_vp_b > 0, np.round(saldo / fator_vp_b, 2), 0.0))
+
+    # Sem juros, o simulador acerta a diferença de arredondamento no primeiro
+    # vencimento e o total pago fecha no valor financiado
+    total_pago = np.where(sem_juros, entrada + valor_financiado, entrada + valor_parcela * qtd_p_pagas + valor_balao * qtd_b)
+
+    invalida = (
+        (qtd_p < np.maximum(prazo_minimo, 1)) | (qtd_p > prazo_maximo)
+        | (valor_total <= 0) | (entrada < 0) | (valor_total <= entrada)
+        | (qtd_b == 0) & (modo >= 1) | recusada
+    )
+    resultado = pd.DataFrame({
+        "Taxa Mensal (%)": taxa_mensal,
+        "Entrada": entrada,
+        "Valor Financiado": valor_financiado,
+        "Qtd Parcelas": qtd_p_pagas,
+        "Valor da Parcela": valor_parcela,
+        "Qtd Balões": qtd_b,
+        "Valor do Balão": valor_balao,
+        "Total Pago": total_pago,
+        "Total de Juros": total_pago - valor_total,
+    }, index=indice).round(2)
+    resultado.loc[invalida] = np.nan
+    return resultado
@@ -0,0 +1,235 @@
+# relatorio_pdf.py
+"""
+Geração rápida do PDF da simulação (cabeçalho com as informações da proposta
+e tabela do cronograma), compartilhada pelos apps.
+
+O `ModeloRelatorio` monta uma única vez o que não muda entre documentos:
+posições e larguras das colunas, métricas das fontes (largura de cada
+caractere, para alinhar valores à direita sem consultar o FPDF a cada célula)
+e a logo, lida e reduzida uma só vez (cada documento decodifica só a versão
+pequena). As linhas da tabela são desenhadas com `text()` e as bordas de
+cada página saem de uma vez, com linhas contínuas, em vez de seis `cell()` com
+borda por linha.
+
+Não depende do Streamlit. Para medir a latência:
+
+    python relatorio_pdf.py [qtd_linhas] [repeticoes]
+"""
+import sys
+import time
+from io import BytesIO
+
+from fpdf import FPDF
+
+from motor_financeiro import formatar_moedas
+
+# --- Layout Padrão ---
+COLUNAS_PADRAO = ["Item", "Tipo", "Data Venc.", "Valor", "Valor Presente", "Desconto Aplicado"]
+LARGURAS_PADRAO = [30, 25, 30, 35, 35, 35]
+ALINHAMENTOS_PADRAO = "LLLRRR"
+FONTE = "Helvetica"  # Mesma fonte core que o FPDF usa para "Arial"
+LATENCIA_ALVO_MS = 50  # Meta para um cronograma de 176 linhas (ver __main__)
+
+
+def formatar_valor(valor):
+    """Valor numérico no padrão brasileiro, sem símbolo (1.234,56)."""
+    return formatar_moedas(valor, simbolo=False)[0]
+
+
+class ModeloRelatorio:
+    """
+    Modelo reutilizável do relatório: colunas, larguras, alinhamentos, tamanho
+    da fonte do cabeçalho da tabela, espaço antes da tabela e logo opcional
+    (caminho ou bytes; reduzida para `largura_logo` mm a 150 dpi).
+    """
+
+    ALTURA_LINHA_INFO = 10
+    ALTURA_CABECALHO = 10
+    ALTURA_LINHA = 8
+    ALTURA_TOTAL = 10
+    FONTE_TITULO = 14
+    FONTE_INFO = 12
+    FONTE_LINHAS = 10
+
+    def __init__(self, colunas=COLUNAS_PADRAO, larguras=LARGURAS_PADRAO, alinhamentos=ALINHAMENTOS_PADRAO,
+                 fonte_cabecalho=12, espaco_tabela=10, logo=None, largura_logo=40):
+        self.colunas = list(colunas)
+        self.larguras = list(larguras)
+        self.alinhamentos = alinhamentos
+        self.fonte_cabecalho = fonte_cabecalho
+        self.espaco_tabela = espaco_tabela
+        self.largura_logo = largura_logo
+        self.logo = self._carregar_logo(logo, largura_logo) if logo is not None else None
+
+        # Métricas das fontes (mm por caractere), lidas uma vez de um documento vazio
+        pdf = FPDF()
+        self.margem_esquerda = pdf.l_margin
+        self.margem_celula = pdf.c_margin
+        self._metricas = {}
+        for estilo, tamanho in (("B", fonte_cabecalho), ("", self.FONTE_LINHAS), ("B", self.FONTE_LINHAS)):
+            pdf.set_font(FONTE, estilo, tamanho)
+            escala = pdf.font_size / 1000
+            self._metricas[estilo, tamanho] = {
+                caractere: largura * escala for caractere, largura in pdf.current_font.cw.items()
+            }
+
+        self.posicoes = [self.margem_esquerda + sum(self.larguras[:i]) for i in range(len(self.larguras) + 1)]
+        self._cabecalho = [
+            (self._posicao_texto(i, texto, "C", ("B", fonte_cabecalho)), texto)
+            for i, texto in enumerate(self.colunas)
+        ]
+
+    @staticmethod
+    def _carregar_logo(logo, largura_logo):
+        from PIL import Image
+
+        dados = logo if isinstance(logo, bytes) else open(logo, "rb").read()
+        imagem = Image.open(BytesIO(dados))
+        largura_px = round(largura_logo / 25.4 * 150)
+        if imagem.format == "PNG" and max(imagem.size) <= largura_px:
+            return dados  # Já no tamanho certo (static/logo_pdf.png, de ativos.py)
+        imagem.thumbnail((largura_px, largura_px))
+        buffer = BytesIO()
+        imagem.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+    def largura_texto(self, texto, fonte):
+        metricas = self._metricas[fonte]
+        return sum(metricas[c] for c in texto)
+
+    def _posicao_texto(self, coluna, texto, alinhamento, fonte, ate_coluna=None):
+        inicio = self.posicoes[coluna]
+        fim = self.posicoes[(ate_coluna if ate_coluna is not None else coluna) + 1]
+        if alinhamento == "L":
+            return inicio + self.margem_celula
+        largura = self.largura_texto(texto, fonte)
+        if alinhamento == "R":
+            return fim - self.margem_celula - largura
+        return (inicio + fim - largura) / 2
+
+    def _linha_base(self, y, altura, tamanho):
+        # Mesmo posicionamento vertical do texto dentro de uma cell() do FPDF
+        return y + altura / 2 + 0.3 * tamanho / 72 * 25.4
+
+    def _desenhar_bordas(self, pdf, y_inicio, limites):
+        """Bordas de um bloco de linhas: uma horizontal por limite e as verticais inteiras."""
+        x_inicio, x_fim = self.posicoes[0], self.posicoes[-1]
+        for y in limites:
+            pdf.line(x_inicio, y, x_fim, y)
+        y_fim = limites[-1]
+        for x in self.posicoes:
+            pdf.line(x, y_inicio, x, y_fim)
+
+    def _desenhar_cabecalho_tabela(self, pdf, y):
+        pdf.set_font(FONTE, "B", self.fonte_cabecalho)
+        base = self._linha_base(y, self.ALTURA_CABECALHO, self.fonte_cabecalho)
+        for x, texto in self._cabecalho:
+            pdf.text(x, base, texto)
+        self._desenhar_bordas(pdf, y, [y, y + self.ALTURA_CABECALHO])
+        return y + self.ALTURA_CABECALHO
+
+    def gerar(self, cronograma, secoes):
+        """
+        Gera o PDF e retorna os bytes. `secoes` é uma lista de (título, linhas)
+        com as informações do cabeçalho; `cronograma` é um motor_financeiro.Cronograma.
+        """
+        pdf = FPDF()
+        self.desenhar(pdf, cronograma, secoes)
+        return bytes(pdf.output())
+
+    def desenhar(self, pdf, cronograma, secoes):
+        """
+        Desenha o relatório em `pdf` a partir de uma nova página. Permite juntar
+        vários relatórios num mesmo documento.
+        """
+        pdf.add_page()
+        if self.logo is not None:
+            # Bytes já reduzidos: o FPDF decodifica só uma logo pequena por documento
+            pdf.image(BytesIO(self.logo), x=pdf.w - pdf.r_margin - self.largura_logo, y=pdf.t_margin, w=self.largura_logo)
+
+        for i, (titulo, linhas) in enumerate(secoes):
+            if i:
+                pdf.ln(5)
+            pdf.set_font(FONTE, "B", self.FONTE_TITULO)
+            pdf.cell(200, self.ALTURA_LINHA_INFO, text=titulo, new_x="LMARGIN", new_y="NEXT")
+            pdf.set_font(FONTE, size=self.FONTE_INFO)
+            for linha in linhas:
+                pdf.cell(200, self.ALTURA_LINHA_INFO, text=linha, new_x="LMARGIN", new_y="NEXT")
+        pdf.ln(self.espaco_tabela)
+
+        limite_pagina = pdf.page_break_trigger
+        fonte_linhas = ("", self.FONTE_LINHAS)
+        alinhamentos = self.alinhamentos
+        colunas = range(len(self.larguras))
+        deslocamento_base = self._linha_base(0, self.ALTURA_LINHA, self.FONTE_LINHAS)
+
+        y_bloco = y = self._desenhar_cabecalho_tabela(pdf, pdf.get_y())
+        limites = [y]
+        pdf.set_font(FONTE, size=self.FONTE_LINHAS)
+        for textos in cronograma.linhas_em_texto():
+            if y + self.ALTURA_LINHA > limite_pagina:
+                self._desenhar_bordas(pdf, y_bloco, limites)
+                pdf.add_page()
+                y_bloco = y = pdf.t_margin
+                limites = [y]
+                pdf.set_font(FONTE, size=self.FONTE_LINHAS)
+            base = y + deslocamento_base
+            for coluna, texto, alinhamento in zip(colunas, textos, alinhamentos):
+                pdf.text(self._posicao_texto(coluna, texto, alinhamento, fonte_linhas), base, texto)
+            y += self.ALTURA_LINHA
+            limites.append(y)
+        self._desenhar_bordas(pdf, y_bloco, limites)
+
+        total = cronograma.total
+        if total:
+            if y + self.ALTURA_TOTAL > limite_pagina:
+                pdf.add_page()
+                y = pdf.t_margin
+            fonte_total = ("B", self.FONTE_LINHAS)
+            pdf.set_font(FONTE, "B", self.FONTE_LINHAS)
+            base = self._linha_base(y, self.ALTURA_TOTAL, self.FONTE_LINHAS)
+            pdf.text(self._posicao_texto(0, "TOTAL", "R", fonte_total, ate_coluna=2), base, "TOTAL")
+            textos_total = formatar_moedas([total[chave] for chave in ("Valor", "Valor_Presente", "Desconto_Aplicado")], simbolo=False)
+            for coluna, texto in zip((3, 4, 5), textos_total):
+                pdf.text(self._posicao_texto(coluna, texto, "R", fonte_total), base, texto)
+            x_inicio, x_fim = self.posicoes[0], self.posicoes[-1]
+            pdf.line(x_inicio, y + self.ALTURA_TOTAL, x_fim, y + self.ALTURA_TOTAL)
+            if y == pdf.t_margin:
+                pdf.line(x_inicio, y, x_fim, y)
+            for x in (self.posicoes[0], self.posicoes[3], self.posicoes[4], self.posicoes[5], self.posicoes[6]):
+                pdf.line(x, y, x, y + self.ALTURA_TOTAL)
+
+
+# --- Benchmark ---
+def medir_latencia(qtd_linhas=176, repeticoes=20, modelo=None):
+    """Tempo médio (ms) para gerar o PDF de um cronograma com `qtd_linhas` linhas."""
+    from datetime import datetime
+
+    from motor_financeiro import calcular_taxas, meses_vencimento, montar_cronograma
+
+    qtd_baloes = qtd_linhas // 13
+    qtd_parcelas = qtd_linhas - qtd_baloes
+    cronograma = montar_cronograma(
+        datetime(2025, 1, 10), calcular_taxas(0.79)['diaria'],
+        meses_vencimento("mensal", qtd_parcelas), [1532.47] * qtd_parcelas,
+        meses_vencimento("anual", qtd_baloes), [18450.90] * qtd_baloes,
+    )
+    secoes = [
+        ("Informações do Imóvel", ["Quadra: 12", "Lote: 7", "Metragem: 360 m²"]),
+        ("Simulação de Financiamento", ["Valor Total do Imóvel: R$ 250.000,00", "Entrada: R$ 15.000,00",
+                                        "Valor Financiado: R$ 235.000,00", "Taxa Mensal Utilizada: 0.790%"]),
+    ]
+    modelo = modelo or ModeloRelatorio()
+    modelo.gerar(cronograma, secoes)  # Aquecimento
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        modelo.gerar(cronograma, secoes)
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+if __name__ == "__main__":
+    qtd = int(sys.argv[1]) if len(sys.argv) > 1 else 176
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    ms = medir_latencia(qtd, repeticoes)
+    situacao = "dentro" if ms <= LATENCIA_ALVO_MS else "ACIMA"
+    print(f"{qtd} linhas: {ms:.1f} ms por PDF ({situacao} da meta de {LATENCIA_ALVO_MS} ms)")
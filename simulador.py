@@ -0,0 +1,412 @@
+# simulador.py
+"""
+Simulador JMD HAMOA de todos os empreendimentos num só app. O empreendimento
+vem do cadastro em empreendimentos.py (faixas de juros, prazos e rótulos) e é
+escolhido na barra lateral ou pelo link (?empreendimento=jatai). Importações,
+caches e motor de cálculo são os mesmos para todos, num único servidor.
+
+Os scripts antigos de cada empreendimento (hamoaf.py, jatai.py...) só chamam
+main() com a chave dele, para manter os endereços já divulgados.
+"""
+import streamlit as st
+from datetime import datetime
+from math import ceil
+from io import BytesIO
+import re  # Importante para o parse_currency
+
+from ativos import LOGO_PDF
+from inicializacao import LOCALE_RESERVA, aplicar_tema, configure_locale, install_and_import, logo_disponivel, mostrar_logo
+import motor_financeiro
+from motor_financeiro import calcular_taxas, fator_anuidade, formatar_moedas
+from empreendimentos import EMPREENDIMENTOS, EMPREENDIMENTO_PADRAO, descrever_faixas, obter_empreendimento, taxa_por_prazo
+
+# --- Configuração de Locale (uma vez por processo, em inicializacao.py) ---
+if configure_locale() == LOCALE_RESERVA:
+    st.warning("Configuração de locale específica não disponível. Usando padrão internacional.")
+
+# --- Dependências (fpdf e openpyxl só são importados quando há exportação) ---
+pd = install_and_import('pandas')
+np = install_and_import('numpy')
+
+# --- Configuração da Página Streamlit e Tema ---
+st.set_page_config(layout="wide")
+
+def set_theme():
+    """
+    Aplica estilos CSS personalizados para um tema escuro
+    e aprimora a aparência dos componentes do Streamlit.
+    Inclui estilos para botões com efeitos de hover e clique.
+    """
+    aplicar_tema("simulador")  # temas/simulador.css
+
+# --- Funções de Cálculo Financeiro ---
+
+def parse_currency(value_str: str) -> float:
+    """
+    Converte uma string de valor monetário (ex: 'R$ 1.500,00') para float (1500.00).
+    Copiado do app2.py.
+    """
+    if not isinstance(value_str, str) or not value_str.strip():
+        return 0.0
+    try:
+        # Remove R$, espaços e pontos de milhar
+        cleaned_value = re.sub(r'[R$\s\.]', '', value_str.strip())
+        # Substitui vírgula decimal por ponto
+        cleaned_value = cleaned_value.replace(',', '.')
+        return float(cleaned_value)
+    except (ValueError, TypeError):
+        return 0.0
+
+def formatar_moeda(valor, simbolo=True):
+    """
+    Formata float para string moeda BR.
+    """
+    try:
+        if isinstance(valor, str) and 'R$' in valor:
+            valor = valor.replace('R$', '').strip()
+        
+        if valor is None or valor == '':
+            return "R$ 0,00" if simbolo else "0,00"
+        
+        if isinstance(valor, str):
+            valor = re.sub(r'\.', '', valor).replace(',', '.')
+            valor = float(valor)
+        
+        return formatar_moedas(valor, simbolo)[0]
+    except Exception:
+        return "R$ 0,00" if simbolo else "0,00"
+
+def determinar_modo_calculo(modalidade):
+    modos = {"mensal": 1, "mensal + balão": 2, "só balão anual": 3, "só balão semestral": 4}
+    return modos.get(modalidade, 1)
+
+def atualizar_baloes(modalidade, qtd_parcelas, tipo_balao=None):
+    try:
+        qtd_parcelas = int(qtd_parcelas)
+        if modalidade == "mensal + balão":
+            intervalo = 12 if tipo_balao == "anual" else 6
+            return qtd_parcelas // intervalo if intervalo > 0 else 0
+        elif modalidade == "só balão anual":
+            return max(ceil(qtd_parcelas / 12), 0)
+        elif modalidade == "só balão semestral":
+            return max(ceil(qtd_parcelas / 6), 0)
+        return 0
+    except Exception:
+        return 0
+
+@st.cache_data(ttl=3600)
+def gerar_cronograma(valor_financiado, valor_parcela_final, valor_balao_final,
+                     qtd_parcelas, qtd_baloes, modalidade, tipo_balao,
+                     data_entrada, taxas, valor_primeira_parcela=None, valor_primeiro_balao=None):
+    try:
+        return motor_financeiro.gerar_cronograma(
+            valor_financiado, valor_parcela_final, valor_balao_final,
+            qtd_parcelas, qtd_baloes, modalidade, tipo_balao,
+            data_entrada, taxas, valor_primeira_parcela, valor_primeiro_balao
+        )
+    except Exception as e:
+        st.error(f"Erro inesperado ao gerar cronograma: {str(e)}.")
+        return []
+
+@st.cache_resource(show_spinner=False)
+def modelo_pdf():
+    """
+    Modelo do PDF (layout, métricas das fontes e logo), montado uma vez por processo.
+    """
+    install_and_import('fpdf2', 'fpdf')
+    from relatorio_pdf import ModeloRelatorio
+    return ModeloRelatorio(logo=LOGO_PDF if LOGO_PDF.exists() else None)
+
+def gerar_pdf(cronograma, dados):
+    secoes = [
+        ("Informações do Imóvel", [
+            f"Quadra: {dados.get('quadra', 'Não informado')}",
+            f"Lote: {dados.get('lote', 'Não informado')}",
+            f"Metragem: {dados.get('metragem', 'Não informado')} m²",
+        ]),
+        ("Simulação de Financiamento", [
+            f"Valor Total do Imóvel: {formatar_moeda(dados['valor_total'])}",
+            f"Entrada: {formatar_moeda(dados['entrada'])}",
+            f"Valor Financiado: {formatar_moeda(dados['valor_financiado'])}",
+            f"Taxa Mensal Utilizada: {dados['taxa_mensal']:.3f}%",
+        ]),
+    ]
+    return BytesIO(modelo_pdf().gerar(cronograma, secoes))
+
+def gerar_excel(cronograma, dados):
+    install_and_import('openpyxl')
+    output = BytesIO()
+    
+    info_df = pd.DataFrame({
+        'Campo': ['Quadra', 'Lote', 'Metragem', 'Valor Total do Imóvel', 'Entrada', 'Valor Financiado', 'Taxa Mensal Utilizada'],
+        'Valor': [
+            dados.get('quadra', 'Não informado'), dados.get('lote', 'Não informado'),
+            f"{dados.get('metragem', 'Não informado')} m²", formatar_moeda(dados.get('valor_total', 0)),
+            formatar_moeda(dados.get('entrada', 0)), formatar_moeda(dados.get('valor_financiado', 0)),
+            f"{dados.get('taxa_mensal', 0):.3f}%"
+        ]
+    })
+    
+    df_final_excel = cronograma.para_dataframe(incluir_total=True)
+
+    colunas_export = ['Item', 'Tipo', 'Data_Vencimento', 'Valor', 'Valor_Presente', 'Desconto_Aplicado']
+    df_final_excel = df_final_excel[colunas_export]
+        
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        info_df.to_excel(writer, sheet_name='Informações da Simulação', index=False)
+        df_final_excel.to_excel(writer, sheet_name='Cronograma de Pagamentos', index=False)
+        
+    output.seek(0)
+    return output
+
+# --- Exportação sob Demanda ---
+# Os arquivos só são gerados quando alguém clica para baixar e ficam em cache
+# pela assinatura do cronograma e pelos dados da simulação. Um erro na geração
+# sobe até o botão de download, que mostra a falha (e não entra no cache).
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def exportar_pdf(assinatura, dados, _cronograma):
+    return gerar_pdf(_cronograma, dados).getvalue()
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def exportar_excel(assinatura, dados, _cronograma):
+    return gerar_excel(_cronograma, dados).getvalue()
+
+# --- Escolha do Empreendimento ---
+def trocar_empreendimento():
+    """Ao trocar de empreendimento, limpa o formulário (os limites de prazo mudam)."""
+    escolhido = st.session_state.empreendimento
+    st.session_state.clear()
+    st.session_state.empreendimento = escolhido
+
+def escolher_empreendimento():
+    if 'empreendimento' not in st.session_state:
+        chave = st.query_params.get("empreendimento", EMPREENDIMENTO_PADRAO)
+        st.session_state.empreendimento = chave if chave in EMPREENDIMENTOS else EMPREENDIMENTO_PADRAO
+    chave = st.sidebar.selectbox("Empreendimento", list(EMPREENDIMENTOS), format_func=lambda c: EMPREENDIMENTOS[c]['nome'], key="empreendimento", on_change=trocar_empreendimento)
+    st.query_params["empreendimento"] = chave
+    return chave
+
+# --- Exibição do Cronograma ---
+# Valores e datas vão para a tela como colunas numéricas; só o column_config
+# define como aparecem. "localized" segue o idioma do navegador (1.234,56 em
+# pt-BR) e o step fixa as casas decimais.
+COLUNAS_CRONOGRAMA = {
+    "Data_Vencimento": st.column_config.DateColumn("Data Venc.", format="DD/MM/YYYY"),
+    "Valor": st.column_config.NumberColumn("Valor (R$)", format="localized", step=0.01),
+    "Valor_Presente": st.column_config.NumberColumn("Valor Presente (R$)", format="localized", step=0.01),
+    "Desconto_Aplicado": st.column_config.NumberColumn("Desconto Aplicado (R$)", format="localized", step=0.01),
+}
+
+# --- Função Principal do Aplicativo Streamlit ---
+def main(empreendimento=None):
+    """
+    Com `empreendimento` (chave do cadastro), o app fica fixo nele; sem, o
+    usuário escolhe na barra lateral.
+    """
+    set_theme()
+    
+    st.write("\n")
+
+    chave = empreendimento or escolher_empreendimento()
+    config = obter_empreendimento(chave)
+    
+    if logo_disponivel():
+        col1, col2 = st.columns([1, 4])
+        with col1:
+            mostrar_logo(200)
+        with col2:
+            st.title(f"**{config['titulo']}**")
+    else:
+        st.title("Simulador Imobiliária Celeste")
+        
+    def reset_form():
+        escolhido = st.session_state.get("empreendimento")
+        st.session_state.clear()
+        if escolhido: st.session_state.empreendimento = escolhido
+
+    with st.container():
+        cols = st.columns(3)
+        quadra = cols[0].text_input("Quadra", key="quadra", placeholder="Ex: 15")
+        lote = cols[1].text_input("Lote", key="lote", placeholder="Ex: 22")
+        metragem = cols[2].text_input("Metragem (m²)", key="metragem", placeholder="Ex: 360")
+    
+    with st.form("simulador_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if config['valores_em_texto']:
+                valor_total_str = st.text_input("Valor Total do Imóvel (R$)", key="valor_total_str", placeholder="Ex: 250.000,00")
+                entrada_str = st.text_input("Entrada (R$)", key="entrada_str", placeholder="Ex: 50.000,00")
+            else:
+                valor_total = st.number_input("Valor Total do Imóvel (R$)", min_value=0.0, step=1000.0, format="%.2f", key="valor_total")
+                entrada = st.number_input("Entrada (R$)", min_value=0.0, step=1000.0, format="%.2f", key="entrada")
+            
+            data_input = st.date_input("Data de Entrada", value=datetime.now(), format="DD/MM/YYYY", key="data_input")
+            
+            # Taxa exibida apenas como referência (a do cálculo vem da faixa de prazo)
+            if config['taxa_exibida'] is None:
+                st.info(descrever_faixas(config))
+            else:
+                st.number_input("Taxa de Juros Mensal Máxima (%)", value=config['taxa_exibida'], step=0.01, format="%.2f", disabled=True)
+            
+            modalidade = st.selectbox("Modalidade de Pagamento", ["mensal", "mensal + balão", "só balão anual", "só balão semestral"], key="modalidade")
+            
+            tipo_balao = None
+            if modalidade == "mensal + balão":
+                tipo_balao = st.selectbox("Tipo de balão:", ["anual", "semestral"], key="tipo_balao")
+            elif "anual" in modalidade: tipo_balao = "anual"
+            elif "semestral" in modalidade: tipo_balao = "semestral"
+        
+        with col2:
+            qtd_parcelas = st.number_input(config['rotulo_prazo'], min_value=config['prazo_minimo'], max_value=config['prazo_maximo'], value=config['prazo_padrao'], step=1, key="qtd_parcelas")
+
+            qtd_baloes = 0
+            if "balão" in modalidade:
+                qtd_baloes = atualizar_baloes(modalidade, qtd_parcelas, tipo_balao)
+                st.write(f"Quantidade de Balões: {qtd_baloes}")
+            
+            if config['valores_em_texto']:
+                valor_parcela_str = st.text_input("Valor da Parcela (R$)", key="valor_parcela_str", placeholder="Deixe em branco para cálculo")
+                st.caption("No plano mensal + balão: se informado, calcula o balão.")
+                
+                valor_balao_str = ""
+                if "balão" in modalidade:
+                    valor_balao_str = st.text_input("Valor do Balão (R$)", key="valor_balao_str", placeholder="Deixe em branco para cálculo")
+                    st.caption("Se informado, calcula a parcela.")
+            else:
+                valor_parcela = st.number_input("Valor da Parcela (R$) (**No plano mensal, só balão anual e só balão semestral deixe 0, No plano mensal+balão digite o valor**)", help="Para 'mensal + balão', se este valor for informado, o sistema calculará o balão.", min_value=0.0, step=100.0, format="%.2f", key="valor_parcela")
+                
+                valor_balao = 0.0
+                if "balão" in modalidade:
+                    valor_balao = st.number_input("Valor do Balão (R$)", help="Para 'mensal + balão', se este valor for informado, o sistema calculará a parcela.", min_value=0.0, step=1000.0, format="%.2f", key="valor_balao")
+        
+        col_b1, col_b2, _ = st.columns([1, 1, 4])
+        submitted = col_b1.form_submit_button("Calcular")
+        col_b2.form_submit_button("Reiniciar", on_click=reset_form)
+    
+    if submitted:
+        try:
+            # --- CONVERSÃO DAS STRINGS PARA FLOAT ---
+            if config['valores_em_texto']:
+                valor_total = parse_currency(valor_total_str)
+                entrada = parse_currency(entrada_str)
+                valor_parcela = parse_currency(valor_parcela_str)
+                valor_balao = parse_currency(valor_balao_str)
+
+            # --- FAIXAS DE JUROS DO EMPREENDIMENTO ---
+            if qtd_parcelas > config['prazo_maximo']:
+                st.error(f"O prazo máximo permitido é de {config['prazo_maximo']} meses.")
+                return
+            taxa_mensal_para_calculo = taxa_por_prazo(chave, qtd_parcelas)
+
+            if valor_total <= 0 or entrada < 0 or valor_total <= entrada:
+                st.error("Verifique os valores de 'Total do Imóvel' e 'Entrada'. O valor financiado deve ser maior que zero.")
+                return
+            
+            valor_financiado = round(max(valor_total - entrada, 0), 2)
+            taxas = calcular_taxas(taxa_mensal_para_calculo)
+            modo = determinar_modo_calculo(modalidade)
+            
+            valor_parcela_final, valor_balao_final = 0.0, 0.0
+            valor_primeira_parcela_ajustada, valor_primeiro_balao_ajustado = None, None
+            
+            if taxa_mensal_para_calculo == 0.0:
+                if modo == 1 and qtd_parcelas > 0:
+                    valor_padrao = round(valor_financiado / qtd_parcelas, 2)
+                    diferenca = round((valor_padrao * qtd_parcelas) - valor_financiado, 2)
+                    valor_parcela_final = valor_padrao
+                    valor_primeira_parcela_ajustada = valor_padrao - diferenca
+                elif modo in [3, 4] and qtd_baloes > 0:
+                    valor_padrao = round(valor_financiado / qtd_baloes, 2)
+                    diferenca = round((valor_padrao * qtd_baloes) - valor_financiado, 2)
+                    valor_balao_final = valor_padrao
+                    valor_primeiro_balao_ajustado = valor_padrao - diferenca
+                elif modo == 2 and qtd_parcelas > 0 and qtd_baloes > 0:
+                    if valor_parcela > 0 and valor_balao == 0:
+                        valor_parcela_final = valor_parcela
+                        vp_restante_baloes = valor_financiado - (valor_parcela * qtd_parcelas)
+                        if vp_restante_baloes < 0:
+                            st.error("O valor total das parcelas excede o valor financiado.")
+                            return
+                        valor_padrao = round(vp_restante_baloes / qtd_baloes, 2)
+                        diferenca = round((valor_padrao * qtd_baloes) - vp_restante_baloes, 2)
+                        valor_balao_final = valor_padrao
+                        valor_primeiro_balao_ajustado = valor_padrao - diferenca
+                    elif valor_balao > 0 and valor_parcela == 0:
+                        valor_balao_final = valor_balao
+                        vp_restante_parcelas = valor_financiado - (valor_balao * qtd_baloes)
+                        if vp_restante_parcelas < 0:
+                            st.error("O valor total dos balões excede o valor financiado.")
+                            return
+                        valor_padrao = round(vp_restante_parcelas / qtd_parcelas, 2)
+                        diferenca = round((valor_padrao * qtd_parcelas) - vp_restante_parcelas, 2)
+                        valor_parcela_final = valor_padrao
+                        valor_primeira_parcela_ajustada = valor_padrao - diferenca
+                    else:
+                        st.error("No modo 'mensal + balão', informe OU o valor da parcela OU o valor do balão para o cálculo, não ambos ou nenhum.")
+                        return
+            else:
+                if modo == 1 and qtd_parcelas > 0:
+                    fator_vp = fator_anuidade(taxas['diaria'], qtd_parcelas, "mensal")
+                    valor_parcela_final = round(valor_financiado / fator_vp, 2) if fator_vp > 0 else 0
+                elif modo in [3, 4] and qtd_baloes > 0:
+                    periodo = "anual" if modo == 3 else "semestral"
+                    fator_vp = fator_anuidade(taxas['diaria'], qtd_baloes, periodo)
+                    valor_balao_final = round(valor_financiado / fator_vp, 2) if fator_vp > 0 else 0
+                elif modo == 2 and qtd_parcelas > 0 and qtd_baloes > 0:
+                    fator_vp_p, fator_vp_b = fator_anuidade(taxas['diaria'], qtd_parcelas, "mensal + balão", tipo_balao)
+                    
+                    if valor_parcela > 0 and valor_balao == 0:
+                        valor_parcela_final = valor_parcela
+                        vp_das_parcelas = valor_parcela_final * fator_vp_p
+                        vp_restante = max(valor_financiado - vp_das_parcelas, 0)
+                        valor_balao_final = round(vp_restante / fator_vp_b, 2) if fator_vp_b > 0 else 0
+                    elif valor_balao > 0 and valor_parcela == 0:
+                        valor_balao_final = valor_balao
+                        vp_dos_baloes = valor_balao_final * fator_vp_b
+                        vp_restante = max(valor_financiado - vp_dos_baloes, 0)
+                        valor_parcela_final = round(vp_restante / fator_vp_p, 2) if fator_vp_p > 0 else 0
+                    else:
+                        st.error("No modo 'mensal + balão', informe OU o valor da parcela OU o valor do balão para o cálculo, não ambos ou nenhum.")
+                        return
+
+            cronograma = gerar_cronograma(
+                valor_financiado, valor_parcela_final, valor_balao_final, 
+                qtd_parcelas, qtd_baloes, modalidade, tipo_balao, 
+                datetime.combine(data_input, datetime.min.time()), taxas, 
+                valor_primeira_parcela=valor_primeira_parcela_ajustada, 
+                valor_primeiro_balao=valor_primeiro_balao_ajustado
+            )
+            
+            st.subheader("Resultados da Simulação")
+            col_res1, col_res2, col_res3, col_res4 = st.columns(4)
+            
+            col_res1.metric("Valor Financiado", formatar_moeda(valor_financiado))
+            col_res2.metric(config['rotulo_taxa'], config['formato_taxa'].format(taxa_mensal_para_calculo))
+            if valor_parcela_final > 0: col_res3.metric("Valor da Parcela", formatar_moeda(valor_parcela_final))
+            if valor_balao_final > 0: col_res4.metric("Valor do Balão", formatar_moeda(valor_balao_final))
+
+            st.subheader("Cronograma de Pagamentos")
+            if cronograma:
+                st.dataframe(cronograma.para_exibicao(), use_container_width=True, hide_index=True, column_config=COLUNAS_CRONOGRAMA)
+
+                total = cronograma.total
+                if total:
+                    col_tot1, col_tot2, col_tot3 = st.columns(3)
+                    col_tot1.metric("Valor Total a Pagar", formatar_moeda(total['Valor']))
+                    col_tot2.metric("Valor Presente Total", formatar_moeda(total['Valor_Presente']))
+                    col_tot3.metric("Total de Juros/Desconto", formatar_moeda(total['Desconto_Aplicado']))
+                    
+                    st.subheader("Exportar Resultados")
+                    export_data = {'valor_total': valor_total, 'entrada': entrada, 'taxa_mensal': taxa_mensal_para_calculo, 'valor_financiado': valor_financiado, 'quadra': quadra, 'lote': lote, 'metragem': metragem}
+                    
+                    col_exp1, col_exp2 = st.columns(2)
+                    col_exp1.download_button("Exportar para PDF", lambda: exportar_pdf(cronograma.assinatura, export_data, cronograma), "simulacao_financiamento.pdf", "application/pdf", on_click="ignore")
+                    
+                    col_exp2.download_button("Exportar para Excel", lambda: exportar_excel(cronograma.assinatura, export_data, cronograma), "simulacao_financiamento.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", on_click="ignore")
+        
+        except Exception as e:
+            st.error(f"Ocorreu um erro durante a simulação: {str(e)}. Por favor, verifique os valores inseridos e tente novamente.")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,282 @@
+# tabela_vendas.py
+"""
+Geração da tabela de vendas da Celeste: uma aba por plano oficial, com os
+valores de entrada, sinal, saldo, parcela e balão de cada lote.
+
+Não depende do Streamlit. O app tabelapreco.py usa estas funções, e a
+regeneração noturna roda direto pela linha de comando:
+
+    python tabela_vendas.py Lotes.xlsx -o Tabela_Vendas_Celeste.xlsx
+"""
+import argparse
+import multiprocessing
+import os
+import re
+import time
+import tracemalloc
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from catalogo_lotes import identificadores_invalidos, ler_planilha_lotes
+from motor_financeiro import fator_anuidade_cacheado
+from regras_comerciais import PCT_VP_BALOES, PLANOS_DISPONIVEIS, extrair_dados_plano
+
+# --- PRÉ-CÁLCULO DOS FATORES ---
+@lru_cache(maxsize=None)
+def pre_calcular_fatores():
+    fatores_planos = {}
+    
+    for plano in PLANOS_DISPONIVEIS:
+        qtd_p, qtd_b, pct_e, t_mensal = extrair_dados_plano(plano)
+        
+        # Fatores não dependem da data base (prazo comercial)
+        f_vp_p = fator_anuidade_cacheado(t_mensal, qtd_p, "mensal")
+        f_vp_b = fator_anuidade_cacheado(t_mensal, qtd_b, "anual")
+        
+        nome_aba = f"{qtd_p}x" + (f" + {qtd_b}B" if qtd_b > 0 else "")
+        
+        fatores_planos[plano] = {
+            'qtd_p': qtd_p, 'qtd_b': qtd_b, 'pct_e': pct_e, 
+            'f_vp_p': f_vp_p, 'f_vp_b': f_vp_b,
+            'nome_aba': nome_aba
+        }
+    return fatores_planos
+
+# --- GERAÇÃO DAS TABELAS SEPARADAS ---
+def preparar_lotes(df_lotes):
+    """
+    Colunas de lote usadas nas tabelas, só com os lotes de valor à vista válido.
+    """
+    v_vista = pd.to_numeric(df_lotes['Valor a Vista'], errors='coerce')
+    validos = v_vista.notna() & (v_vista > 0)
+    df_validos = df_lotes.loc[validos]
+
+    if 'Área em Metro Quadrado' in df_validos: area = pd.to_numeric(df_validos['Área em Metro Quadrado'], errors='coerce').to_numpy(dtype=np.float64)
+    else: area = np.zeros(len(df_validos))
+    v_vista = v_vista[validos].to_numpy(dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        val_m2 = np.where(area > 0, v_vista / area, 0)
+
+    def texto(coluna):
+        if coluna not in df_validos: return np.full(len(df_validos), '', dtype=object)
+        return df_validos[coluna].astype(str).str.replace('.0', '', regex=False).to_numpy(dtype=object)
+
+    return {'Quadra': texto('Quadra'), 'Lote': texto('Lote'), 'M²': area, 'Valor do M²': val_m2, 'Valor à Vista': v_vista}
+
+def gerar_tabelas_por_plano(df_lotes):
+    """
+    Monta uma tabela por plano. Os valores saem de uma única conta matricial:
+    o vetor de valores à vista (lotes) contra os vetores de percentual de
+    entrada e fatores de VP (planos); cada aba é uma coluna dessas matrizes.
+    """
+    fatores = list(pre_calcular_fatores().values())
+    lotes = preparar_lotes(df_lotes)
+    qtd_lotes = len(lotes['Valor à Vista'])
+
+    pct_e = np.array([fat['pct_e'] for fat in fatores])
+    qtd_p = np.array([fat['qtd_p'] for fat in fatores])
+    qtd_b = np.array([fat['qtd_b'] for fat in fatores])
+    f_vp_p = np.array([fat['f_vp_p'] for fat in fatores], dtype=np.float64)
+    f_vp_b = np.array([fat['f_vp_b'] for fat in fatores], dtype=np.float64)
+
+    # Matrizes lotes x planos
+    v_vista = lotes['Valor à Vista'][:, None]
+    entrada_total = v_vista * pct_e
+    entrada_3x = entrada_total / 3
+    financiado = v_vista - entrada_total
+    vp_baloes = np.where(qtd_b > 0, v_vista * PCT_VP_BALOES, 0)
+    vp_parcelas = financiado - vp_baloes
+    with np.errstate(divide='ignore', invalid='ignore'):
+        valor_parcela = np.where((qtd_p > 0) & (f_vp_p > 0), vp_parcelas / f_vp_p, 0)
+        valor_balao = np.where((qtd_b > 0) & (f_vp_b > 0), vp_baloes / f_vp_b, 0)
+
+    dicionario_tabelas = {}
+    for j, fat in enumerate(fatores):
+        colunas = dict(lotes)
+        colunas.update({
+            '% Entrada': f"{int(fat['pct_e'] * 100)}%",
+            'Entrada Comercial (A Vista)': entrada_total[:, j],
+            'Sinal 3x': entrada_3x[:, j],
+            'Saldo Financiado': financiado[:, j],
+            'Qtd Parcelas': np.full(qtd_lotes, fat['qtd_p']),
+            'Valor da Parcela': valor_parcela[:, j],
+        })
+        if fat['qtd_b'] > 0:
+            colunas['Qtd Balões'] = np.full(qtd_lotes, fat['qtd_b'])
+            colunas['Valor do Balão'] = valor_balao[:, j]
+        dicionario_tabelas[fat['nome_aba']] = pd.DataFrame(colunas)
+
+    return dicionario_tabelas
+
+# --- GRAVAÇÃO DA PLANILHA ---
+FORMATO_MOEDA = '"R$" #,##0.00'
+FORMATOS_COLUNAS = {
+    'M²': '#,##0.00 "m²"',
+    'Valor do M²': FORMATO_MOEDA,
+    'Valor à Vista': FORMATO_MOEDA,
+    'Entrada Comercial (A Vista)': FORMATO_MOEDA,
+    'Sinal 3x': FORMATO_MOEDA,
+    'Saldo Financiado': FORMATO_MOEDA,
+    'Valor da Parcela': FORMATO_MOEDA,
+    'Valor do Balão': FORMATO_MOEDA,
+}
+
+def _valores_coluna(serie):
+    """Valores Python da coluna, com NaN virando célula vazia."""
+    valores = serie.to_numpy()
+    if valores.dtype.kind == 'f' and np.isnan(valores).any():
+        return np.where(np.isnan(valores), None, valores).tolist()
+    return valores.tolist()
+
+def _registrar_estilos(ws):
+    """
+    Registra os estilos da planilha sempre na mesma ordem. Assim os ids de
+    estilo são iguais em qualquer processo, e abas gravadas separadamente
+    podem ser montadas no mesmo arquivo.
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    estilos = [WriteOnlyCell(ws)]
+    estilos[0].font = Font(bold=True)
+    for formato in dict.fromkeys(FORMATOS_COLUNAS.values()):
+        estilos.append(WriteOnlyCell(ws))
+        estilos[-1].number_format = formato
+    for celula in estilos:
+        celula.style_id  # o id é atribuído no primeiro acesso
+
+def _escrever_aba(ws, df_plan):
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    cabecalho = []
+    for coluna in df_plan.columns:
+        celula = WriteOnlyCell(ws, value=coluna)
+        celula.font = Font(bold=True)
+        cabecalho.append(celula)
+    ws.append(cabecalho)
+
+    # Uma célula formatada por coluna, reaproveitada a cada linha
+    celulas_formatadas = {}
+    for i, coluna in enumerate(df_plan.columns):
+        if coluna in FORMATOS_COLUNAS:
+            celulas_formatadas[i] = WriteOnlyCell(ws)
+            celulas_formatadas[i].number_format = FORMATOS_COLUNAS[coluna]
+
+    for linha in zip(*(_valores_coluna(df_plan[c]) for c in df_plan.columns)):
+        linha = list(linha)
+        for i, celula in celulas_formatadas.items():
+            if linha[i] is not None:
+                celula.value = linha[i]
+                linha[i] = celula
+        ws.append(linha)
+
+# --- Gravação em Paralelo ---
+# Cada processo do pool (spawn) leva cerca de 1 s para subir, reimportando
+# pandas e openpyxl, enquanto uma linha grava em ~0,33 ms (547 lotes x 20
+# planos: 3,4 s sequencial). Abaixo de MIN_LINHAS_PARALELO linhas, subir o
+# pool custa mais do que economiza, e a gravação fica sequencial.
+MIN_LINHAS_PARALELO = 30_000
+
+def nucleos_disponiveis():
+    """Núcleos em que este processo pode rodar (afinidade), não os da máquina."""
+    try: return len(os.sched_getaffinity(0))
+    except AttributeError: return os.cpu_count() or 1  # Sem sched_getaffinity (Windows, macOS)
+
+def _serializar_aba(nome_aba, df_plan):
+    """
+    Grava uma aba sozinha (em um processo do pool) e devolve o XML dela.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(nome_aba)
+    _registrar_estilos(ws)
+    _escrever_aba(ws, df_plan)
+    arquivo = BytesIO()
+    wb.save(arquivo)
+    with zipfile.ZipFile(arquivo) as pacote:
+        return pacote.read('xl/worksheets/sheet1.xml')
+
+def escrever_planilha(dicionario_tabelas, destino, trabalhadores=1):
+    """
+    Grava uma aba por plano em `destino` (caminho ou BytesIO) e devolve o
+    tamanho do arquivo em bytes.
+
+    Usa o modo write-only do openpyxl: cada linha vai direto para o arquivo,
+    sem manter o modelo de células das abas em memória. Valores monetários e
+    metragens saem como números, com formato de moeda/m² aplicado na célula.
+
+    Com `trabalhadores` > 1 e ao menos MIN_LINHAS_PARALELO linhas, as abas
+    são gravadas em paralelo num pool de processos (limitado aos núcleos
+    disponíveis) e o arquivo final é montado com o XML de cada uma.
+    """
+    from openpyxl import Workbook  # Só quando há planilha a gravar (importar custa ~150 ms)
+
+    if sum(len(df_plan) for df_plan in dicionario_tabelas.values()) < MIN_LINHAS_PARALELO: trabalhadores = 1
+    trabalhadores = min(trabalhadores or 1, len(dicionario_tabelas), nucleos_disponiveis())
+    wb = Workbook(write_only=True)
+    for i, (nome_aba, df_plan) in enumerate(dicionario_tabelas.items()):
+        ws = wb.create_sheet(nome_aba)
+        if i == 0: _registrar_estilos(ws)
+        if trabalhadores <= 1: _escrever_aba(ws, df_plan)
+
+    if trabalhadores <= 1:
+        wb.save(destino)
+    else:
+        with ProcessPoolExecutor(max_workers=trabalhadores, mp_context=multiprocessing.get_context('spawn')) as pool:
+            xml_abas = list(pool.map(_serializar_aba, dicionario_tabelas.keys(), dicionario_tabelas.values()))
+
+        # Esqueleto com as abas vazias; o XML de cada aba substitui o do esqueleto
+        esqueleto = BytesIO()
+        wb.save(esqueleto)
+        with zipfile.ZipFile(esqueleto) as origem, zipfile.ZipFile(destino, 'w', zipfile.ZIP_DEFLATED) as pacote:
+            for item in origem.infolist():
+                dados = origem.read(item.filename)
+                numero_aba = re.fullmatch(r'xl/worksheets/sheet(\d+)\.xml', item.filename)
+                if numero_aba: dados = xml_abas[int(numero_aba.group(1)) - 1]
+                pacote.writestr(item, dados)
+
+    if hasattr(destino, 'getbuffer'): return destino.getbuffer().nbytes
+    return os.path.getsize(destino)
+
+# --- LINHA DE COMANDO ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera a tabela de vendas (uma aba por plano) a partir da planilha de lotes.")
+    parser.add_argument("planilha", help="Planilha de lotes (.xlsx ou .csv) com IDENTIFICADOR, Área em Metro Quadrado e Valor a Vista")
+    parser.add_argument("-o", "--saida", help="Arquivo .xlsx de saída (padrão: Tabela_Vendas_Celeste_<data>.xlsx)")
+    parser.add_argument("-j", "--trabalhadores", type=int, default=nucleos_disponiveis(), help=f"Processos gravando abas em paralelo, a partir de {MIN_LINHAS_PARALELO} linhas (padrão: núcleos disponíveis; 1 = sequencial)")
+    parser.add_argument("--memoria", action="store_true", help="Mede o pico de memória com tracemalloc (deixa a gravação bem mais lenta)")
+    args = parser.parse_args(argv)
+    saida = args.saida or f"Tabela_Vendas_Celeste_{datetime.now().strftime('%d-%m-%Y')}.xlsx"
+
+    if args.memoria: tracemalloc.start()
+    inicio = time.perf_counter()
+
+    df_lotes = ler_planilha_lotes(args.planilha)
+    invalidos = identificadores_invalidos(df_lotes)
+    if len(invalidos):
+        print(f"Aviso: {len(invalidos)} linha(s) com IDENTIFICADOR fora do padrão 'QD.01 LT.01' ficaram sem quadra/lote:")
+        for linha, identificador in invalidos.head(20).items(): print(f"  linha {linha}: {identificador!r}")
+    dicionario_tabelas = gerar_tabelas_por_plano(df_lotes)
+    fim_calculo = time.perf_counter()
+    tamanho = escrever_planilha(dicionario_tabelas, saida, args.trabalhadores)
+    fim = time.perf_counter()
+
+    linhas = sum(len(df) for df in dicionario_tabelas.values())
+    print(f"{len(df_lotes)} lotes x {len(dicionario_tabelas)} planos = {linhas} linhas gravadas em {saida} ({tamanho / 1024:,.0f} KiB)")
+    print(f"Cálculo: {fim_calculo - inicio:.2f} s | Gravação: {fim - fim_calculo:.2f} s | Total: {fim - inicio:.2f} s")
+    print(f"Vazão: {linhas / (fim - inicio):,.0f} linhas/s")
+    if args.memoria:
+        _, pico_memoria = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"Pico de memória (processo principal): {pico_memoria / 2**20:.1f} MiB")
+
+if __name__ == '__main__':
+    main()